@@ -16,6 +16,7 @@ from ingestion.eia_client import (  # type: ignore[import]
     EIAClient,
     EIAClientError,
     default_params,
+    typed_frame,
 )
 
-__all__ = ["EIAClient", "EIAClientError", "default_params"]
+__all__ = ["EIAClient", "EIAClientError", "default_params", "typed_frame"]
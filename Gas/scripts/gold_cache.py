@@ -0,0 +1,61 @@
+"""
+Process-level cache for gold-layer parquet reads.
+
+Several visualization scripts read master_model_ready.parquet. When they run
+in the same process (a notebook kernel or a common runner) the parse is shared.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+
+# Columns charts plot directly; float32 is ample at screen resolution
+PLOT_FLOAT32_COLUMNS = ("price_rbob", "retail_price", "inventory_mbbl", "utilization_pct")
+
+
+@lru_cache(maxsize=4)
+def _read_gold(path: str, columns: Optional[tuple], mtime_ns: int) -> pd.DataFrame:
+    # mtime_ns is only part of the cache key so a rewritten file is re-read
+    return pd.read_parquet(path, columns=list(columns) if columns is not None else None)
+
+
+def load_gold(path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Read a gold-layer parquet file, reusing a cached parse when possible.
+
+    Args:
+        path: Parquet file to read
+        columns: Optional subset of columns to load
+
+    Returns:
+        Shallow copy of the cached frame; callers may add or replace columns
+        but must not modify values in place.
+    """
+    path = Path(path)
+    key = tuple(columns) if columns is not None else None
+    return _read_gold(str(path), key, path.stat().st_mtime_ns).copy(deep=False)
+
+
+def downcast_plot_columns(df: pd.DataFrame, columns: Sequence[str] = PLOT_FLOAT32_COLUMNS) -> pd.DataFrame:
+    """
+    Store the listed columns that are present in ``df`` as float32.
+
+    Halves the memory a plotting frame holds for these columns. Only use it on
+    frames that feed charts directly; residuals and differences of prices
+    should stay in float64.
+
+    Args:
+        df: Frame returned by load_gold; modified in place and returned
+        columns: Columns to downcast when present
+
+    Returns:
+        The same frame, for chaining.
+    """
+    for col in columns:
+        if col in df:
+            df[col] = df[col].astype("float32")
+    return df
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator, Tuple
 
 import numpy as np
 import pandas as pd
@@ -33,6 +34,32 @@ from models.baseline_models import (
 )
 
 
+def make_all_horizon_datasets(
+    df: pd.DataFrame, horizons: Iterable[int]
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Yield (horizon, frame) pairs with a target_h{h} column and its target_date.
+
+    The frame is sorted once and every horizon's target is a slice of the same
+    retail_price array, rather than a shift + dropna per horizon.
+    """
+    df_sorted = df.sort_values("date", kind="stable").reset_index(drop=True)
+    prices = df_sorted["retail_price"].to_numpy(dtype=np.float64)
+    dates = df_sorted["date"].to_numpy(dtype="datetime64[ns]")
+
+    for h in horizons:
+        n = max(len(df_sorted) - h, 0)
+        target = prices[h:h + n]
+        sub = df_sorted.iloc[:n].copy()
+        sub[f"target_h{h}"] = target
+        sub["target_date"] = dates[:n] + np.timedelta64(h, "D")
+        # Rows past the end are already sliced off; only interior gaps need dropping
+        missing = np.isnan(target)
+        if missing.any():
+            sub = sub.loc[~missing].reset_index(drop=True)
+        yield h, sub
+
+
 def investigate_discrepancy():
     """Compare baseline vs walk-forward methodologies to find discrepancy source."""
     
@@ -54,8 +81,9 @@ def investigate_discrepancy():
     print("=" * 80)
     
     baseline_test_start = pd.Timestamp("2024-10-01")
-    baseline_train = df[df["date"] < baseline_test_start].copy()
-    baseline_test = df[df["date"] >= baseline_test_start].copy()
+    # Boolean indexing already returns new frames, and they are only read below
+    baseline_train = df[df["date"] < baseline_test_start]
+    baseline_test = df[df["date"] >= baseline_test_start]
     
     print(f"\nTrain: {len(baseline_train)} rows (before {baseline_test_start.date()})")
     print(f"Test:  {len(baseline_test)} rows (from {baseline_test_start.date()} onward)")
@@ -89,10 +117,7 @@ def investigate_discrepancy():
     print("=" * 80)
     
     # Create 21-day horizon dataset
-    df_h21 = df.sort_values("date").copy()
-    df_h21["target_h21"] = df_h21["retail_price"].shift(-21)
-    df_h21["target_date"] = df_h21["date"] + pd.Timedelta(days=21)
-    df_h21 = df_h21.dropna(subset=["target_h21"]).reset_index(drop=True)
+    _, df_h21 = next(make_all_horizon_datasets(df, [21]))
     
     print(f"\nHorizon dataset: {len(df_h21)} rows")
     
@@ -104,8 +129,8 @@ def investigate_discrepancy():
     train_mask = df_h21["target_date"] < oct_start
     test_mask = (df_h21["target_date"] >= oct_start) & (df_h21["target_date"] <= oct_end)
     
-    wf_train = df_h21.loc[train_mask].copy()
-    wf_test = df_h21.loc[test_mask].copy()
+    wf_train = df_h21.loc[train_mask]
+    wf_test = df_h21.loc[test_mask]
     
     print(f"\nTrain: {len(wf_train)} rows (target_date < {oct_start.date()})")
     print(f"Test:  {len(wf_test)} rows (target_date in Oct {year})")
@@ -8,6 +8,10 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from gold_cache import load_gold
 
 
 def parse_args() -> argparse.Namespace:
@@ -43,56 +47,63 @@ def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def scatter_plot(df: pd.DataFrame, output_path: Path) -> None:
-    plt.figure(figsize=(8, 5))
-    plt.scatter(df["rbob_up"], df["retail_change"], color="#E74C3C", alpha=0.6, label="Wholesale up", edgecolors="white", linewidths=0.3)
-    plt.scatter(np.abs(df["rbob_down"]), df["retail_change"], color="#3498DB", alpha=0.6, label="Wholesale down", edgecolors="white", linewidths=0.3)
-    plt.xlabel("Wholesale change ($/gal)")
-    plt.ylabel("Retail change ($/gal)")
-    plt.title("Retail response to positive vs. negative wholesale moves")
-    plt.grid(alpha=0.2)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=160)
-    plt.close()
+def _resolve_axes(fig: Figure | None, ax: Axes | None, figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    """Return the caller's figure/axes pair, creating one when none is supplied."""
+    if ax is None:
+        return plt.subplots(figsize=figsize)
+    return (fig if fig is not None else ax.figure), ax
+
+
+def scatter_plot(df: pd.DataFrame, output_path: Path, fig: Figure | None = None, ax: Axes | None = None) -> Figure:
+    fig, ax = _resolve_axes(fig, ax, (8, 5))
+    ax.scatter(df["rbob_up"], df["retail_change"], color="#E74C3C", alpha=0.6, label="Wholesale up", edgecolors="white", linewidths=0.3)
+    ax.scatter(np.abs(df["rbob_down"]), df["retail_change"], color="#3498DB", alpha=0.6, label="Wholesale down", edgecolors="white", linewidths=0.3)
+    ax.set_xlabel("Wholesale change ($/gal)")
+    ax.set_ylabel("Retail change ($/gal)")
+    ax.set_title("Retail response to positive vs. negative wholesale moves")
+    ax.grid(alpha=0.2)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=160)
+    return fig
 
 
-def bar_plot(metrics_json: Path, output_path: Path) -> None:
+def bar_plot(metrics_json: Path, output_path: Path, fig: Figure | None = None, ax: Axes | None = None) -> Figure:
     import json
     metrics = json.loads(metrics_json.read_text())
     coef_up = metrics.get("coef_up", np.nan)
     coef_down = metrics.get("coef_down", np.nan)
     errors = [metrics.get("p_up", np.nan), metrics.get("p_down", np.nan)]
 
-    plt.figure(figsize=(6, 4))
-    bars = plt.bar(["Wholesale up", "Wholesale down"], [coef_up, coef_down], color=["#E74C3C", "#3498DB"])
-    plt.ylabel("Estimated pass-through coefficient")
-    plt.title("Asymmetric pass-through coefficients")
+    fig, ax = _resolve_axes(fig, ax, (6, 4))
+    bars = ax.bar(["Wholesale up", "Wholesale down"], [coef_up, coef_down], color=["#E74C3C", "#3498DB"])
+    ax.set_ylabel("Estimated pass-through coefficient")
+    ax.set_title("Asymmetric pass-through coefficients")
     for bar, pval in zip(bars, errors):
         label = f"p={pval:.3f}" if isinstance(pval, (float, int)) else ""
-        plt.text(bar.get_x() + bar.get_width() / 2, bar.get_height(), label, ha="center", va="bottom")
-    plt.grid(axis="y", alpha=0.2)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=160)
-    plt.close()
+        ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height(), label, ha="center", va="bottom")
+    ax.grid(axis="y", alpha=0.2)
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=160)
+    return fig
 
 
-def time_series_heatmap(df: pd.DataFrame, output_path: Path) -> None:
+def time_series_heatmap(df: pd.DataFrame, output_path: Path, fig: Figure | None = None, ax: Axes | None = None) -> Figure:
     df = df.copy()
     df["month"] = df["date"].dt.to_period("M")
     grouped = df.groupby("month").agg({"rbob_up": "mean", "rbob_down": "mean", "retail_change": "mean"}).reset_index()
     grouped["month"] = grouped["month"].astype(str)
     pivot = grouped.pivot_table(index="month", values=["rbob_up", "rbob_down", "retail_change"])
 
-    plt.figure(figsize=(8, 6))
-    plt.imshow(pivot.T, aspect="auto", cmap="coolwarm")
-    plt.yticks(range(len(pivot.columns)), ["Wholesale up", "Wholesale down", "Retail change"])
-    plt.xticks(range(len(pivot.index)), pivot.index, rotation=90)
-    plt.colorbar(label="Average change ($/gal)")
-    plt.title("Monthly average pass-through dynamics")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=160)
-    plt.close()
+    fig, ax = _resolve_axes(fig, ax, (8, 6))
+    image = ax.imshow(pivot.T, aspect="auto", cmap="coolwarm")
+    ax.set_yticks(range(len(pivot.columns)), ["Wholesale up", "Wholesale down", "Retail change"])
+    ax.set_xticks(range(len(pivot.index)), pivot.index, rotation=90)
+    fig.colorbar(image, ax=ax, label="Average change ($/gal)")
+    ax.set_title("Monthly average pass-through dynamics")
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=160)
+    return fig
 
 
 def main() -> None:
@@ -100,16 +111,22 @@ def main() -> None:
     output_dir = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_parquet(args.data_path)
+    df = load_gold(args.data_path, columns=["date", "price_rbob", "retail_price"])
     df["date"] = pd.to_datetime(df["date"])
     engineered = engineer_features(df)
 
-    scatter_plot(engineered, output_dir / "asym_scatter.png")
-    time_series_heatmap(engineered, output_dir / "asym_heatmap.png")
+    # One figure is shared by the scatter and heatmap; the heatmap goes last
+    # because its colorbar permanently steals space from the axes.
+    fig, ax = plt.subplots(figsize=(8, 5))
+    scatter_plot(engineered, output_dir / "asym_scatter.png", fig=fig, ax=ax)
+    ax.clear()
+    fig.set_size_inches(8, 6)
+    time_series_heatmap(engineered, output_dir / "asym_heatmap.png", fig=fig, ax=ax)
+    plt.close(fig)
 
     metrics_json = args.asym_dir / "asym_metrics.json"
     if metrics_json.exists():
-        bar_plot(metrics_json, output_dir / "asym_coef_bar.png")
+        plt.close(bar_plot(metrics_json, output_dir / "asym_coef_bar.png"))
 
     print(f"✓ Asymmetric pass-through visuals saved to {output_dir.resolve()}")
 
@@ -8,28 +8,105 @@ Creates detailed visualizations of:
 4. Training metrics over time
 """
 
-import matplotlib.pyplot as plt
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+# Only savefig is used, so skip GUI toolkit initialisation on every figure.
+matplotlib.use('Agg', force=True)
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 import seaborn as sns
 
+from gold_cache import downcast_plot_columns, load_gold
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Key variables shown in the data-quality correlation heatmap
+KEY_FEATURES = ['price_rbob', 'price_wti', 'retail_price', 'inventory_mbbl',
+                'utilization_pct', 'crack_spread', 'days_supply']
+
+# On-screen dashboards: 150 dpi is a quarter of the raster work of 300, and
+# fixed margins replace bbox_inches='tight' (which forces a second draw pass).
+DASHBOARD_DPI = 150
+DASHBOARD_MARGINS = dict(left=0.06, right=0.96, bottom=0.12, top=0.92)
+
+# Upper bound on vertices for dense time-series lines
+MAX_LINE_POINTS = 1000
+
+
+def _input_digest(inputs: list[Path]) -> str:
+    """Short fingerprint of the inputs (size + first 4KB of each) plus this script."""
+    h = hashlib.blake2b(digest_size=8)
+    for path in [*inputs, Path(__file__)]:
+        h.update(str(path.stat().st_size).encode())
+        with open(path, 'rb') as f:
+            h.update(f.read(4096))
+    return h.hexdigest()
+
+
+def _needs_rebuild(inputs: list[Path], output: Path) -> bool:
+    """True if ``output`` is missing, older than an input, or its .stamp digest is stale."""
+    stamp = output.with_suffix('.stamp')
+    if not output.exists() or not stamp.exists():
+        return True
+    output_mtime = output.stat().st_mtime
+    if any(path.stat().st_mtime > output_mtime for path in [*inputs, Path(__file__)]):
+        return True
+    return stamp.read_text().strip() != _input_digest(inputs)
+
+
+def _write_stamp(inputs: list[Path], output: Path) -> None:
+    output.with_suffix('.stamp').write_text(_input_digest(inputs))
+
+
+def _annotated_heatmap(ax, frame: pd.DataFrame, fmt: str, cmap: str, vmin=None, vmax=None,
+                       aspect='auto'):
+    """Draw ``frame`` as an imshow heatmap with one centred value label per non-NaN cell."""
+    values = frame.to_numpy()
+    im = ax.imshow(values, aspect=aspect, cmap=cmap, vmin=vmin, vmax=vmax)
+    ax.set_xticks(range(frame.shape[1]))
+    ax.set_xticklabels(frame.columns)
+    ax.set_yticks(range(frame.shape[0]))
+    ax.set_yticklabels(frame.index)
+    for (i, j), v in np.ndenumerate(values):
+        if np.isnan(v):  # leave missing cells blank, as seaborn's annot does
+            continue
+        ax.text(j, i, format(v, fmt), ha='center', va='center', fontsize=8)
+    return im
+
 
 def create_model_performance_dashboard(output_path: Path):
     """Create comprehensive model performance comparison dashboard."""
     
     # Load actual metrics
-    metrics_path = Path(__file__).resolve().parents[1] / "outputs" / "models" / "model_metrics_summary.csv"
+    metrics_path = REPO_ROOT / "outputs" / "models" / "model_metrics_summary.csv"
     
     if not metrics_path.exists():
         print(f"⚠️  Metrics file not found: {metrics_path}")
         return
     
+    if not _needs_rebuild([metrics_path], output_path):
+        print(f"✓ Up to date, skipping {output_path.name}")
+        return
+    
     df = pd.read_csv(metrics_path)
     
-    fig = plt.figure(figsize=(16, 10))
+    fig = Figure(figsize=(16, 10))
+    FigureCanvasAgg(fig)
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+    fig.subplots_adjust(**DASHBOARD_MARGINS)
     
     # Main title
     fig.suptitle('Model Performance Dashboard', fontsize=20, fontweight='bold', y=0.98)
@@ -56,13 +133,10 @@ def create_model_performance_dashboard(output_path: Path):
     ax1.legend(fontsize=10)
     ax1.grid(axis='y', alpha=0.3)
     
-    # Add value labels on bars
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0.01:  # Only show if significant
-                ax1.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.4f}', ha='center', va='bottom', fontsize=9)
+    # Add value labels on bars (only where significant)
+    for bars, values in [(bars1, train_rmse), (bars2, test_rmse)]:
+        ax1.bar_label(bars, labels=[f'{v:.4f}' if v > 0.01 else '' for v in values],
+                      padding=2, fontsize=9)
     
     # ===== SUBPLOT 2: R² Score Comparison =====
     ax2 = fig.add_subplot(gs[0, 2])
@@ -76,12 +150,8 @@ def create_model_performance_dashboard(output_path: Path):
     ax2.axvline(x=0, color='black', linestyle='--', linewidth=1)
     ax2.grid(axis='x', alpha=0.3)
     
-    for i, (bar, val) in enumerate(zip(bars, test_r2)):
-        if abs(val) > 1:
-            label_text = f'{val:.1f}'
-        else:
-            label_text = f'{val:.3f}'
-        ax2.text(val + 0.1, i, label_text, va='center', fontsize=9, fontweight='bold')
+    ax2.bar_label(bars, labels=[f'{val:.1f}' if abs(val) > 1 else f'{val:.3f}' for val in test_r2],
+                  padding=5, fontsize=9, fontweight='bold')
     
     # ===== SUBPLOT 3: MAPE Comparison =====
     ax3 = fig.add_subplot(gs[1, :2])
@@ -95,10 +165,7 @@ def create_model_performance_dashboard(output_path: Path):
     ax3.grid(axis='y', alpha=0.3)
     
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.2f}%', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax3.bar_label(bars, labels=[f'{v:.2f}%' for v in test_mape], fontsize=10, fontweight='bold')
     
     # ===== SUBPLOT 4: Model Summary Table =====
     ax4 = fig.add_subplot(gs[1, 2])
@@ -139,17 +206,17 @@ def create_model_performance_dashboard(output_path: Path):
     # ===== SUBPLOT 5: Train vs Test Scatter =====
     ax5 = fig.add_subplot(gs[2, :])
     
-    train_vals = df['train_rmse'].tolist()
-    test_vals = df['test_rmse'].tolist()
+    train_vals = df['train_rmse'].to_numpy()
+    test_vals = df['test_rmse'].to_numpy()
     
-    for i, model in enumerate(models):
-        ax5.scatter(train_vals[i], test_vals[i], s=200, alpha=0.7, 
-                   label=model, edgecolors='black', linewidth=2)
-        ax5.annotate(model, (train_vals[i], test_vals[i]), 
-                    xytext=(5, 5), textcoords='offset points', fontsize=9)
+    # One collection for all models; tab10 indices match the default color cycle
+    ax5.scatter(train_vals, test_vals, s=200, alpha=0.7, c=np.arange(len(models)),
+               cmap='tab10', vmin=0, vmax=9, edgecolors='black', linewidth=2)
+    for model, xy in zip(models, zip(train_vals, test_vals)):
+        ax5.annotate(model, xy, xytext=(5, 5), textcoords='offset points', fontsize=9)
     
     # Perfect prediction line
-    max_val = max(max(train_vals), max(test_vals))
+    max_val = np.concatenate([train_vals, test_vals]).max()
     ax5.plot([0, max_val], [0, max_val], 'k--', alpha=0.5, linewidth=2, label='Perfect (Train=Test)')
     
     ax5.set_xlabel('Train RMSE', fontsize=12, fontweight='bold')
@@ -159,32 +226,42 @@ def create_model_performance_dashboard(output_path: Path):
     ax5.legend(fontsize=9)
     ax5.grid(alpha=0.3)
     
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=DASHBOARD_DPI)
+    _write_stamp([metrics_path], output_path)
     print(f"✓ Saved model performance dashboard to {output_path}")
 
 
 def create_walk_forward_visualization(output_path: Path):
     """Create comprehensive walk-forward validation visualization."""
     
-    metrics_path = Path(__file__).resolve().parents[1] / "outputs" / "walk_forward" / "walk_forward_metrics.csv"
+    metrics_path = REPO_ROOT / "outputs" / "walk_forward" / "walk_forward_metrics.csv"
     
     if not metrics_path.exists():
         print(f"⚠️  Walk-forward metrics not found: {metrics_path}")
         return
     
+    if not _needs_rebuild([metrics_path], output_path):
+        print(f"✓ Up to date, skipping {output_path.name}")
+        return
+    
     df = pd.read_csv(metrics_path)
     
-    fig = plt.figure(figsize=(18, 10))
+    # One group-by pass for every per-horizon statistic below
+    stats = df.groupby('horizon')[['rmse', 'r2', 'mape_pct']].agg(['mean', 'std'])
+    horizon_stats = stats['rmse'].reset_index()
+    r2_stats = stats['r2'].reset_index()
+    mape_stats = stats['mape_pct'].reset_index()
+    
+    fig = Figure(figsize=(18, 10))
+    FigureCanvasAgg(fig)
     gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
+    fig.subplots_adjust(**DASHBOARD_MARGINS)
     
     fig.suptitle('Walk-Forward Validation Analysis', fontsize=20, fontweight='bold', y=0.98)
     
     # ===== SUBPLOT 1: RMSE by Horizon =====
     ax1 = fig.add_subplot(gs[0, 0])
     
-    horizon_stats = df.groupby('horizon')['rmse'].agg(['mean', 'std']).reset_index()
-    
     ax1.errorbar(horizon_stats['horizon'], horizon_stats['mean'], 
                 yerr=horizon_stats['std'], marker='o', markersize=10,
                 linewidth=2, capsize=5, capthick=2, color='#E74C3C', alpha=0.8)
@@ -198,8 +275,6 @@ def create_walk_forward_visualization(output_path: Path):
     # ===== SUBPLOT 2: R² by Horizon =====
     ax2 = fig.add_subplot(gs[0, 1])
     
-    r2_stats = df.groupby('horizon')['r2'].agg(['mean', 'std']).reset_index()
-    
     colors = ['#27AE60' if r > 0 else '#E74C3C' for r in r2_stats['mean']]
     bars = ax2.bar(r2_stats['horizon'], r2_stats['mean'], 
                    color=colors, alpha=0.7, edgecolor='black', linewidth=2)
@@ -210,16 +285,12 @@ def create_walk_forward_visualization(output_path: Path):
     ax2.set_title('Predictive Power vs Horizon', fontsize=13, fontweight='bold')
     ax2.grid(axis='y', alpha=0.3)
     
-    for bar, val in zip(bars, r2_stats['mean']):
-        label_y = val + 0.1 if val > 0 else val - 0.15
-        ax2.text(bar.get_x() + bar.get_width()/2., label_y,
-                f'{val:.2f}', ha='center', fontsize=9, fontweight='bold')
+    ax2.bar_label(bars, labels=[f'{v:.2f}' for v in r2_stats['mean']], padding=3,
+                  fontsize=9, fontweight='bold')
     
     # ===== SUBPLOT 3: MAPE by Horizon =====
     ax3 = fig.add_subplot(gs[0, 2])
     
-    mape_stats = df.groupby('horizon')['mape_pct'].agg(['mean', 'std']).reset_index()
-    
     ax3.plot(mape_stats['horizon'], mape_stats['mean'], 
             marker='s', markersize=10, linewidth=3, color='#9B59B6', alpha=0.8)
     ax3.fill_between(mape_stats['horizon'], 
@@ -238,9 +309,8 @@ def create_walk_forward_visualization(output_path: Path):
     
     pivot = df.pivot(index='year', columns='horizon', values='rmse')
     
-    sns.heatmap(pivot, annot=True, fmt='.4f', cmap='RdYlGn_r', 
-               cbar_kws={'label': 'RMSE ($/gallon)'}, ax=ax4,
-               linewidths=1, linecolor='white')
+    im = _annotated_heatmap(ax4, pivot, fmt='.4f', cmap='RdYlGn_r')
+    fig.colorbar(im, ax=ax4, label='RMSE ($/gallon)')
     
     ax4.set_xlabel('Forecast Horizon (days)', fontsize=12, fontweight='bold')
     ax4.set_ylabel('Year', fontsize=12, fontweight='bold')
@@ -256,102 +326,152 @@ def create_walk_forward_visualization(output_path: Path):
     ax5.set_title('Optimal Alpha Distribution\n(Ridge Regularization)', 
                  fontsize=13, fontweight='bold')
     
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=DASHBOARD_DPI)
+    _write_stamp([metrics_path], output_path)
     print(f"✓ Saved walk-forward visualization to {output_path}")
 
 
 def create_feature_importance_chart(output_path: Path):
     """Create feature importance visualization from Ridge model."""
     
-    import pickle
-    
-    model_path = Path(__file__).resolve().parents[1] / "outputs" / "models" / "ridge_model.pkl"
+    model_path = REPO_ROOT / "outputs" / "models" / "ridge_model.pkl"
     
     if not model_path.exists():
         print(f"⚠️  Ridge model not found: {model_path}")
         return
     
+    if not _needs_rebuild([model_path], output_path):
+        print(f"✓ Up to date, skipping {output_path.name}")
+        return
+    
+    import pickle
+    
     # Load model
     with open(model_path, 'rb') as f:
         model = pickle.load(f)
     
     # Get feature names from baseline_models
     import sys
-    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+    sys.path.insert(0, str(REPO_ROOT / "src"))
     from models.baseline_models import COMMON_FEATURES
     
     # Extract coefficients
-    coefs = model.coef_
-    feature_importance = pd.DataFrame({
-        'feature': COMMON_FEATURES,
-        'coefficient': coefs,
-        'abs_coefficient': np.abs(coefs)
-    }).sort_values('abs_coefficient', ascending=False)
+    coefs = np.asarray(model.coef_)
+    if len(COMMON_FEATURES) != coefs.shape[0]:
+        print(f"⚠️  Ridge model has {coefs.shape[0]} coefficients but COMMON_FEATURES lists "
+              f"{len(COMMON_FEATURES)}; skipping feature importance chart")
+        return
+    
+    features = np.asarray(COMMON_FEATURES)
+    abs_coefs = np.abs(coefs)
+    order = np.argsort(-abs_coefs, kind='stable')
+    sorted_feats, sorted_coefs, sorted_abs = features[order], coefs[order], abs_coefs[order]
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 10))
+    fig = Figure(figsize=(16, 10))
+    FigureCanvasAgg(fig)
+    ax1, ax2 = fig.subplots(1, 2)
     
     fig.suptitle('Ridge Regression Feature Importance', fontsize=20, fontweight='bold')
     
     # ===== SUBPLOT 1: Absolute Importance =====
-    colors = ['#E74C3C' if c > 0 else '#3498DB' for c in feature_importance['coefficient']]
+    colors = np.where(sorted_coefs > 0, '#E74C3C', '#3498DB')
     
-    ax1.barh(range(len(feature_importance)), feature_importance['abs_coefficient'],
-            color=colors, alpha=0.7, edgecolor='black')
-    ax1.set_yticks(range(len(feature_importance)))
-    ax1.set_yticklabels(feature_importance['feature'], fontsize=9)
+    bars = ax1.barh(range(len(order)), sorted_abs, color=colors, alpha=0.7, edgecolor='black')
+    ax1.set_yticks(range(len(order)))
+    ax1.set_yticklabels(sorted_feats, fontsize=9)
     ax1.set_xlabel('Absolute Coefficient Magnitude', fontsize=12, fontweight='bold')
     ax1.set_title('Feature Importance (by magnitude)', fontsize=14, fontweight='bold')
     ax1.grid(axis='x', alpha=0.3)
     
     # Add value labels
-    for i, val in enumerate(feature_importance['abs_coefficient']):
-        ax1.text(val, i, f' {val:.4f}', va='center', fontsize=8)
+    ax1.bar_label(bars, fmt='%.4f', padding=2, fontsize=8)
     
     # ===== SUBPLOT 2: Signed Coefficients =====
-    sorted_by_coef = feature_importance.sort_values('coefficient')
-    colors2 = ['#E74C3C' if c > 0 else '#3498DB' for c in sorted_by_coef['coefficient']]
+    order2 = np.argsort(coefs, kind='stable')
+    colors2 = np.where(coefs[order2] > 0, '#E74C3C', '#3498DB')
     
-    ax2.barh(range(len(sorted_by_coef)), sorted_by_coef['coefficient'],
-            color=colors2, alpha=0.7, edgecolor='black')
-    ax2.set_yticks(range(len(sorted_by_coef)))
-    ax2.set_yticklabels(sorted_by_coef['feature'], fontsize=9)
+    bars = ax2.barh(range(len(order2)), coefs[order2], color=colors2, alpha=0.7, edgecolor='black')
+    ax2.set_yticks(range(len(order2)))
+    ax2.set_yticklabels(features[order2], fontsize=9)
     ax2.set_xlabel('Coefficient Value', fontsize=12, fontweight='bold')
     ax2.set_title('Feature Direction (positive = increases price)', fontsize=14, fontweight='bold')
     ax2.axvline(x=0, color='black', linestyle='--', linewidth=2)
     ax2.grid(axis='x', alpha=0.3)
     
-    # Add value labels
-    for i, val in enumerate(sorted_by_coef['coefficient']):
-        x_pos = val + 0.01 if val > 0 else val - 0.01
-        ha = 'left' if val > 0 else 'right'
-        ax2.text(x_pos, i, f'{val:.4f}', va='center', ha=ha, fontsize=8)
+    # Add value labels (bar_label places negatives on the left end automatically)
+    ax2.bar_label(bars, fmt='%.4f', padding=3, fontsize=8)
     
     # Legend
     red_patch = mpatches.Patch(color='#E74C3C', label='Positive (↑ feature → ↑ price)', alpha=0.7)
     blue_patch = mpatches.Patch(color='#3498DB', label='Negative (↑ feature → ↓ price)', alpha=0.7)
     ax2.legend(handles=[red_patch, blue_patch], loc='lower right', fontsize=10)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=DASHBOARD_DPI)
+    _write_stamp([model_path], output_path)
     print(f"✓ Saved feature importance chart to {output_path}")
 
 
+def _parquet_null_counts(path: Path) -> pd.Series:
+    """Per-column null counts from parquet row-group statistics (NaN if unrecorded)."""
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    counts = pd.Series(0.0, index=parquet_file.schema_arrow.names)
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            stats = column.statistics
+            if stats is None or not stats.has_null_count:
+                counts[column.path_in_schema] = np.nan
+            else:
+                counts[column.path_in_schema] += stats.null_count
+    return counts
+
+
+def _downsample_min(x: np.ndarray, y: np.ndarray, max_points: int = MAX_LINE_POINTS):
+    """
+    Cap a line at ``max_points`` vertices, keeping each bucket's minimum so gaps
+    in the data stay visible after downsampling.
+    """
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    step = -(-n // max_points)  # ceil division, so ~2k rows still get bucketed
+    starts = np.arange(0, n, step)
+    return x[starts], np.minimum.reduceat(y, starts)
+
+
 def create_data_quality_dashboard(output_path: Path):
     """Create data quality and pipeline health visualization."""
     
-    gold_path = Path(__file__).resolve().parents[1] / "data" / "gold" / "master_model_ready.parquet"
+    gold_path = REPO_ROOT / "data" / "gold" / "master_model_ready.parquet"
     
     if not gold_path.exists():
         print(f"⚠️  Gold layer not found: {gold_path}")
         return
     
-    df = pd.read_parquet(gold_path)
+    if not _needs_rebuild([gold_path], output_path):
+        print(f"✓ Up to date, skipping {output_path.name}")
+        return
+    
+    # Null counts and the column list come from the parquet footer, so only the
+    # plotted columns plus any column that actually holds nulls are read.
+    null_counts = _parquet_null_counts(gold_path)
+    all_columns = null_counts.index.tolist()
+    available_features = [f for f in KEY_FEATURES if f in all_columns]
+    sparse_columns = null_counts[null_counts.isna() | (null_counts > 0)].index.tolist()
+    read_columns = list(dict.fromkeys(['date'] + available_features + sparse_columns))
+    
+    df = load_gold(gold_path, columns=read_columns)
     df['date'] = pd.to_datetime(df['date'])
+    null_counts = null_counts.fillna(df.isnull().sum()).astype(int)
+    downcast_plot_columns(df)
     
-    fig = plt.figure(figsize=(16, 10))
+    fig = Figure(figsize=(16, 10))
+    FigureCanvasAgg(fig)
     gs = fig.add_gridspec(3, 3, hspace=0.4, wspace=0.3)
+    fig.subplots_adjust(**DASHBOARD_MARGINS)
     
     fig.suptitle('Data Quality & Pipeline Health Dashboard', fontsize=20, fontweight='bold', y=0.98)
     
@@ -359,10 +479,20 @@ def create_data_quality_dashboard(output_path: Path):
     ax1 = fig.add_subplot(gs[0, :])
     
     df_sorted = df.sort_values('date')
-    completeness = (1 - df_sorted.isnull().sum(axis=1) / len(df_sorted.columns)) * 100
-    
-    ax1.plot(df_sorted['date'], completeness, linewidth=2, color='#27AE60', alpha=0.8)
-    ax1.fill_between(df_sorted['date'], completeness, 100, alpha=0.2, color='#27AE60')
+    # Row-wise null count on the raw arrays: np.isnan over the numeric block,
+    # pd.isna only for the (few) non-numeric columns such as date.
+    numeric = df_sorted.select_dtypes('number')
+    other = df_sorted.drop(columns=numeric.columns)
+    row_nulls = np.isnan(numeric.to_numpy(dtype=np.float64)).sum(axis=1)
+    if other.shape[1]:
+        row_nulls += pd.isna(other.to_numpy()).sum(axis=1)
+    completeness = 100.0 * (1.0 - row_nulls / len(all_columns))
+    dates = df_sorted['date'].to_numpy()
+    
+    dates, completeness = _downsample_min(dates, completeness)
+    
+    ax1.plot(dates, completeness, linewidth=2, color='#27AE60', alpha=0.8)
+    ax1.fill_between(dates, completeness, 100, alpha=0.2, color='#27AE60')
     ax1.axhline(y=100, color='green', linestyle='--', linewidth=2, label='Perfect (100%)')
     
     ax1.set_xlabel('Date', fontsize=12, fontweight='bold')
@@ -375,7 +505,7 @@ def create_data_quality_dashboard(output_path: Path):
     # ===== SUBPLOT 2: Missing Data by Feature =====
     ax2 = fig.add_subplot(gs[1, 0])
     
-    missing = df.isnull().sum().sort_values(ascending=False)
+    missing = null_counts.sort_values(ascending=False)
     if missing.sum() > 0:
         top_missing = missing[missing > 0].head(10)
         ax2.barh(range(len(top_missing)), top_missing.values, color='#E74C3C', alpha=0.7)
@@ -401,7 +531,7 @@ def create_data_quality_dashboard(output_path: Path):
     stats = {
         'Total Rows': len(df),
         'Date Range (days)': date_range,
-        'Features': len(df.columns) - 1,  # Exclude date
+        'Features': len(all_columns) - 1,  # Exclude date
         'Avg Rows/Year': f'{rows_per_year:.0f}',
         'Min Date': df['date'].min().strftime('%Y-%m-%d'),
         'Max Date': df['date'].max().strftime('%Y-%m-%d')
@@ -419,57 +549,67 @@ def create_data_quality_dashboard(output_path: Path):
     # ===== SUBPLOT 4: October Data Distribution =====
     ax4 = fig.add_subplot(gs[1, 2])
     
-    df['month'] = df['date'].dt.month
-    df['year'] = df['date'].dt.year
+    dt = df['date'].dt
+    october_mask = dt.month.to_numpy() == 10
+    october_years = dt.year.to_numpy()[october_mask]
+    october_counts = pd.Series(october_years).value_counts().sort_index()
     
-    october_counts = df[df['month'] == 10].groupby('year').size()
-    
-    ax4.bar(october_counts.index, october_counts.values, color='#F39C12', alpha=0.7, edgecolor='black')
+    bars = ax4.bar(october_counts.index, october_counts.values, color='#F39C12', alpha=0.7, edgecolor='black')
     ax4.set_xlabel('Year', fontsize=12, fontweight='bold')
     ax4.set_ylabel('October Days', fontsize=12, fontweight='bold')
     ax4.set_title('October Data Availability', fontsize=13, fontweight='bold')
     ax4.grid(axis='y', alpha=0.3)
     
-    for x, y in zip(october_counts.index, october_counts.values):
-        ax4.text(x, y+0.5, str(y), ha='center', fontsize=9, fontweight='bold')
+    ax4.bar_label(bars, padding=2, fontsize=9, fontweight='bold')
     
     # ===== SUBPLOT 5: Feature Correlation Heatmap =====
     ax5 = fig.add_subplot(gs[2, :])
     
-    # Select key features for correlation
-    key_features = ['price_rbob', 'price_wti', 'retail_price', 'inventory_mbbl', 
-                   'utilization_pct', 'crack_spread', 'days_supply']
-    
-    available_features = [f for f in key_features if f in df.columns]
-    
     if len(available_features) > 1:
-        corr = df[available_features].corr()
+        arr = df[available_features].to_numpy(dtype=np.float32)
+        if np.isnan(arr).any():
+            corr = df[available_features].corr()  # pairwise NaN-aware path
+        else:
+            corr = pd.DataFrame(np.corrcoef(arr, rowvar=False),
+                                index=available_features, columns=available_features)
         
-        sns.heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm', center=0,
-                   square=True, linewidths=1, cbar_kws={"shrink": 0.8}, ax=ax5,
-                   vmin=-1, vmax=1)
+        im = _annotated_heatmap(ax5, corr, fmt='.2f', cmap='coolwarm', vmin=-1, vmax=1,
+                                aspect='equal')
+        ax5.tick_params(axis='x', labelrotation=90)
+        fig.colorbar(im, ax=ax5, shrink=0.8)
         
         ax5.set_title('Feature Correlation Matrix (Key Variables)', fontsize=14, fontweight='bold')
     
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=DASHBOARD_DPI)
+    _write_stamp([gold_path], output_path)
     print(f"✓ Saved data quality dashboard to {output_path}")
 
 
+def _run(task):
+    """Process-pool trampoline: unpack ``(create_fn, output_path)`` and render."""
+    create_fn, output_path = task
+    create_fn(output_path)
+
+
 def main():
     """Generate all performance visualizations."""
     
-    output_dir = Path(__file__).resolve().parents[1] / "outputs" / "visualizations"
+    output_dir = REPO_ROOT / "outputs" / "visualizations"
     output_dir.mkdir(parents=True, exist_ok=True)
     
     print("\n" + "="*70)
     print("📊 GENERATING PERFORMANCE VISUALIZATIONS")
     print("="*70 + "\n")
     
-    create_model_performance_dashboard(output_dir / "05_model_performance_dashboard.png")
-    create_walk_forward_visualization(output_dir / "06_walk_forward_analysis.png")
-    create_feature_importance_chart(output_dir / "07_feature_importance.png")
-    create_data_quality_dashboard(output_dir / "08_data_quality_dashboard.png")
+    tasks = [
+        (create_model_performance_dashboard, output_dir / "05_model_performance_dashboard.png"),
+        (create_walk_forward_visualization, output_dir / "06_walk_forward_analysis.png"),
+        (create_feature_importance_chart, output_dir / "07_feature_importance.png"),
+        (create_data_quality_dashboard, output_dir / "08_data_quality_dashboard.png"),
+    ]
+    # Dashboards are independent and CPU-bound in Agg, so render them in separate processes
+    with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+        list(executor.map(_run, tasks))
     
     print("\n" + "="*70)
     print(f"✓ All performance visualizations saved to {output_dir}")
@@ -3,32 +3,50 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
-import matplotlib.pyplot as plt
+import matplotlib
+
+# Only savefig is used, so skip GUI toolkit initialisation on every figure.
+matplotlib.use("Agg", force=True)
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 
+from gold_cache import load_gold
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Charts are viewed on screen; 120 dpi keeps them sharp at ~half the pixels of 160.
+FIGURE_DPI = 120
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Visualize quantile regression artefacts.")
     parser.add_argument(
         "--data-path",
         type=Path,
-        default=Path(__file__).resolve().parents[1] / "data" / "gold" / "master_model_ready.parquet",
+        default=REPO_ROOT / "data" / "gold" / "master_model_ready.parquet",
         help="Path to model-ready dataset (for actual targets).",
     )
     parser.add_argument(
         "--qr-dir",
         type=Path,
-        default=Path(__file__).resolve().parents[1] / "outputs" / "quantile_regression",
+        default=REPO_ROOT / "outputs" / "quantile_regression",
         help="Directory where quantile regression outputs were saved.",
     )
     parser.add_argument(
         "--output-dir",
         type=Path,
-        default=Path(__file__).resolve().parents[1] / "outputs" / "quantile_regression",
+        default=REPO_ROOT / "outputs" / "quantile_regression",
         help="Directory to save figures (defaults to QR output directory).",
     )
     parser.add_argument(
@@ -40,6 +58,11 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _read_quantile_csv(csv_file: Path) -> Tuple[float, pd.DataFrame]:
+    quantile = int(csv_file.stem.split("_")[1]) / 100
+    return quantile, pd.read_csv(csv_file, parse_dates=["date"], engine="pyarrow")
+
+
 def load_quantile_predictions(qr_dir: Path) -> Dict[float, pd.DataFrame]:
     prediction_files = list(qr_dir.glob("quantile_*_predictions.csv"))
     if not prediction_files:
@@ -47,48 +70,60 @@ def load_quantile_predictions(qr_dir: Path) -> Dict[float, pd.DataFrame]:
             f"No quantile prediction files found in {qr_dir}. Run train_quantile_models.py first."
         )
 
-    quantile_frames: Dict[float, pd.DataFrame] = {}
-    for csv_file in prediction_files:
-        quantile = int(csv_file.stem.split("_")[1]) / 100
-        df = pd.read_csv(csv_file, parse_dates=["date"])
-        quantile_frames[quantile] = df
+    # The pyarrow CSV parser releases the GIL, so the files are read concurrently.
+    with ThreadPoolExecutor(max_workers=min(8, len(prediction_files))) as executor:
+        quantile_frames: Dict[float, pd.DataFrame] = dict(executor.map(_read_quantile_csv, prediction_files))
     return quantile_frames
 
 
 def plot_fan_chart(actual_df: pd.DataFrame, quantiles: Dict[float, pd.DataFrame], output_path: Path, window_days: int) -> None:
-    merged = actual_df[["date", "retail_price"]].copy()
-    for q, df in quantiles.items():
-        pivot = df[df["split"] == "test"]["date"].to_frame()
-        pivot[f"q{int(q*100)}"] = df[df["split"] == "test"]["prediction"].values
-        merged = merged.merge(pivot, on="date", how="left")
+    long = pd.concat(
+        [df.loc[df["split"] == "test", ["date", "prediction"]].assign(quantile=f"q{int(q*100)}") for q, df in quantiles.items()],
+        ignore_index=True,
+    )
+    wide = long.pivot(index="date", columns="quantile", values="prediction")
+    merged = actual_df[["date", "retail_price"]].set_index("date").join(wide, how="inner").reset_index()
 
     merged = merged.dropna(subset=[col for col in merged.columns if col.startswith("q")])
     merged = merged.sort_values("date")
     if window_days and len(merged) > window_days:
         merged = merged.iloc[-window_days:]
 
-    plt.figure(figsize=(12, 6))
-    plt.plot(merged["date"], merged["retail_price"], color="#1ABC9C", linewidth=2.5, label="Actual Retail")
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.plot(merged["date"], merged["retail_price"], color="#1ABC9C", linewidth=2.5, label="Actual Retail")
 
     quantile_cols = sorted([col for col in merged.columns if col.startswith("q")])
     if len(quantile_cols) >= 2:
         lower = merged[quantile_cols[0]]
         upper = merged[quantile_cols[-1]]
-        plt.fill_between(merged["date"], lower, upper, color="#F39C12", alpha=0.2, label=f"{quantile_cols[0][-2:]}–{quantile_cols[-1][-2:]} band")
+        ax.fill_between(merged["date"], lower, upper, color="#F39C12", alpha=0.2, label=f"{quantile_cols[0][-2:]}–{quantile_cols[-1][-2:]} band")
     if "q50" in quantile_cols:
-        plt.plot(merged["date"], merged["q50"], color="#D35400", linestyle="--", linewidth=2, label="Median Forecast")
-    for col in quantile_cols:
-        if col not in {"q50", quantile_cols[0], quantile_cols[-1]}:
-            plt.plot(merged["date"], merged[col], linestyle=":", linewidth=1, alpha=0.7, label=f"{col.upper()}")
-
-    plt.title("Quantile Regression Fan Chart (Test Period)")
-    plt.xlabel("Date")
-    plt.ylabel("$/gal")
-    plt.grid(alpha=0.2)
-    plt.legend(loc="upper left", ncol=2, fontsize=9)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=160)
-    plt.close()
+        ax.plot(merged["date"], merged["q50"], color="#D35400", linestyle="--", linewidth=2, label="Median Forecast")
+    inner_cols = [col for col in quantile_cols if col not in {"q50", quantile_cols[0], quantile_cols[-1]}]
+    if inner_cols:
+        # One collection for all inner quantiles instead of a Line2D per quantile
+        x = mdates.date2num(merged["date"])
+        segments = [np.column_stack([x, merged[col].to_numpy()]) for col in inner_cols]
+        cycle = matplotlib.rcParams["axes.prop_cycle"].by_key()["color"]
+        ax.add_collection(LineCollection(
+            segments,
+            colors=[cycle[i % len(cycle)] for i in range(len(inner_cols))],
+            linestyles=":",
+            linewidths=1,
+            alpha=0.7,
+            label=", ".join(col.upper() for col in inner_cols),
+        ))
+        ax.autoscale_view()
+
+    ax.set_title("Quantile Regression Fan Chart (Test Period)")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("$/gal")
+    ax.grid(alpha=0.2)
+    ax.legend(loc="upper left", ncol=2, fontsize=9)
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=FIGURE_DPI)
 
 
 def plot_pinball_bar(summary_csv: Path, output_path: Path) -> None:
@@ -97,18 +132,19 @@ def plot_pinball_bar(summary_csv: Path, output_path: Path) -> None:
     x = [f"{int(q*100)}" for q in summary_df["quantile"]]
     width = 0.35
 
-    plt.figure(figsize=(8, 5))
-    plt.bar(np.arange(len(x)) - width/2, summary_df["train_pinball"], width, color="#2980B9", label="Train")
-    plt.bar(np.arange(len(x)) + width/2, summary_df["test_pinball"], width, color="#E74C3C", label="Test")
-    plt.title("Pinball Loss by Quantile")
-    plt.xlabel("Quantile (%)")
-    plt.ylabel("Pinball Loss ($)")
-    plt.xticks(np.arange(len(x)), x)
-    plt.legend()
-    plt.grid(alpha=0.2, axis="y")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=160)
-    plt.close()
+    fig = Figure(figsize=(8, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.bar(np.arange(len(x)) - width/2, summary_df["train_pinball"], width, color="#2980B9", label="Train")
+    ax.bar(np.arange(len(x)) + width/2, summary_df["test_pinball"], width, color="#E74C3C", label="Test")
+    ax.set_title("Pinball Loss by Quantile")
+    ax.set_xlabel("Quantile (%)")
+    ax.set_ylabel("Pinball Loss ($)")
+    ax.set_xticks(np.arange(len(x)), x)
+    ax.legend()
+    ax.grid(alpha=0.2, axis="y")
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=FIGURE_DPI)
 
 
 def plot_quantile_residuals(actual_df: pd.DataFrame, quantiles: Dict[float, pd.DataFrame], output_path: Path) -> None:
@@ -119,21 +155,22 @@ def plot_quantile_residuals(actual_df: pd.DataFrame, quantiles: Dict[float, pd.D
     merged = actual_df.merge(median_test[["date", "prediction"]], on="date", how="inner")
     merged["residual"] = merged["retail_price"] - merged["prediction"]
 
-    plt.figure(figsize=(10, 5))
-    plt.scatter(merged["prediction"], merged["residual"], alpha=0.5, color="#8E44AD", edgecolors="white", linewidths=0.3)
-    plt.axhline(0, color="black", linestyle="--", linewidth=1)
-    plt.title("Median Quantile Residuals (Actual - Q50)")
-    plt.xlabel("Median Forecast ($/gal)")
-    plt.ylabel("Residual ($/gal)")
-    plt.grid(alpha=0.25)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=160)
-    plt.close()
+    fig = Figure(figsize=(10, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.scatter(merged["prediction"], merged["residual"], alpha=0.5, color="#8E44AD", edgecolors="white", linewidths=0.3)
+    ax.axhline(0, color="black", linestyle="--", linewidth=1)
+    ax.set_title("Median Quantile Residuals (Actual - Q50)")
+    ax.set_xlabel("Median Forecast ($/gal)")
+    ax.set_ylabel("Residual ($/gal)")
+    ax.grid(alpha=0.25)
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=FIGURE_DPI)
 
 
 def main() -> None:
     args = parse_args()
-    actual_df = pd.read_parquet(args.data_path)[["date", "retail_price"]]
+    actual_df = load_gold(args.data_path, columns=["date", "retail_price"])
     actual_df["date"] = pd.to_datetime(actual_df["date"])
 
     quantiles = load_quantile_predictions(args.qr_dir)
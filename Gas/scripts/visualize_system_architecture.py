@@ -8,20 +8,108 @@ Creates comprehensive diagrams showing:
 4. Complete system overview
 """
 
+import hashlib
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+import matplotlib
+
+# Diagrams are only saved to disk, so workers never need a GUI backend.
+matplotlib.use('Agg', force=True)
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import FancyBboxPatch
 import numpy as np
 from pathlib import Path
+from PIL import Image
+
+DIAGRAM_DPI = 300
+# The 18x12" overview has no fine detail; 150 dpi quarters its pixel count
+OVERVIEW_DPI = 150
+# zlib level 1 encodes several times faster than the default 6 for a modest size increase
+PNG_PIL_KWARGS = {'compress_level': 1, 'optimize': False}
+
+
+def _diagram_axes(fig: Optional[Figure], figsize, xlim, ylim):
+    """Clear the caller's figure (or create one) and return a blank axes spanning the diagram."""
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig.clear()
+        fig.set_size_inches(figsize)
+    # Fixed full-bleed margins; tight_layout and bbox_inches='tight' would each
+    # cost an extra measuring pass and do nothing useful on axis-off diagrams
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+    ax = fig.add_subplot(111)
+    ax.set_xlim(0, xlim)
+    ax.set_ylim(0, ylim)
+    ax.axis('off')
+    return fig, ax
+
+
+@lru_cache(maxsize=None)
+def _font(size, weight='normal', style='normal', family=None) -> FontProperties:
+    """Shared FontProperties for the per-item labels drawn in loops."""
+    return FontProperties(size=size, weight=weight, style=style, family=family)
+
+
+def _add_boxes(ax, boxes, boxstyle, **style):
+    """Draw a group of rounded boxes, given as (x, y, width, height), as one collection."""
+    patches = [FancyBboxPatch((x, y), w, h, boxstyle=boxstyle) for x, y, w, h in boxes]
+    collection = PatchCollection(patches, match_original=False, **style)
+    ax.add_collection(collection)
+    return collection
+
+
+def _add_circles(ax, xs, ys, radius, **style):
+    """Draw data-space circles of ``radius`` as a single scatter collection."""
+    # Circles in data units render as ellipses on these non-square axes, so the
+    # marker is an ellipse with the same aspect and a width of 2*radius in points
+    x_scale = ax.bbox.width / np.ptp(ax.get_xlim())
+    y_scale = ax.bbox.height / np.ptp(ax.get_ylim())
+    theta = np.linspace(0, 2 * np.pi, 65)
+    marker = np.column_stack([np.cos(theta), np.sin(theta) * y_scale / x_scale])
+    size = (2 * radius * x_scale * 72 / ax.figure.dpi) ** 2
+    return ax.scatter(xs, ys, s=size, marker=marker, **style)
 
 
-def create_medallion_architecture_diagram(output_path: Path):
+def _add_arrows(ax, starts, ends, head_length=4.0, head_width=2.0, shrink=2.0, **style):
+    """Draw a bundle of open-headed arrows (as arrowstyle='->') as one LineCollection.
+
+    Head sizes and the end shrink are in points, matching annotate's defaults.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    # Work in points so heads keep their shape on non-square axes
+    scale = np.array([ax.bbox.width / np.ptp(ax.get_xlim()),
+                      ax.bbox.height / np.ptp(ax.get_ylim())]) * 72 / ax.figure.dpi
+    vec = (ends - starts) * scale
+    unit = vec / np.linalg.norm(vec, axis=1, keepdims=True)
+    normal = unit[:, ::-1] * [-1, 1]
+    tail = starts + unit * shrink / scale
+    tip = ends - unit * shrink / scale
+    back = tip - unit * head_length / scale
+    left = back + normal * head_width / scale
+    right = back - normal * head_width / scale
+    # One polyline per arrow, so alpha is applied once where shaft and head meet
+    paths = np.stack([tail, tip, left, tip, right], axis=1)
+    collection = LineCollection(paths, capstyle='butt', **style)
+    ax.add_collection(collection)
+    return collection
+
+
+def create_medallion_architecture_diagram(fig: Optional[Figure] = None) -> Figure:
     """Visualize the Bronze → Silver → Gold data pipeline."""
     
-    fig, ax = plt.subplots(figsize=(16, 10))
-    ax.set_xlim(0, 10)
-    ax.set_ylim(0, 10)
-    ax.axis('off')
+    fig, ax = _diagram_axes(fig, (16, 10), 10, 10)
     
     # Title
     ax.text(5, 9.5, 'Medallion Architecture: Data Flow Pipeline', 
@@ -32,11 +120,13 @@ def create_medallion_architecture_diagram(output_path: Path):
     silver_color = '#C0C0C0'
     gold_color = '#FFD700'
     
+    # Layer containers
+    bronze_y = silver_y = gold_y = 7.5
+    _add_boxes(ax, [(0.5, bronze_y-0.8, 2.5, 1.6), (3.5, silver_y-0.8, 2.5, 1.6), (6.5, gold_y-0.8, 2.5, 1.6)],
+               "round,pad=0.1", facecolors=[bronze_color, silver_color, gold_color],
+               edgecolors='black', linewidths=2, alpha=0.3)
+    
     # ===== BRONZE LAYER =====
-    bronze_y = 7.5
-    ax.add_patch(FancyBboxPatch((0.5, bronze_y-0.8), 2.5, 1.6, 
-                                boxstyle="round,pad=0.1", 
-                                facecolor=bronze_color, edgecolor='black', linewidth=2, alpha=0.3))
     ax.text(1.75, bronze_y+0.5, 'BRONZE LAYER', fontsize=14, fontweight='bold', ha='center')
     ax.text(1.75, bronze_y+0.1, 'Raw Data Ingestion', fontsize=10, ha='center', style='italic')
     
@@ -47,19 +137,14 @@ def create_medallion_architecture_diagram(output_path: Path):
         ('EIA Retail', 'Weekly retail\ngas prices')
     ]
     
-    for i, (source, desc) in enumerate(bronze_sources):
-        y_pos = bronze_y - 0.3 - i*0.35
-        ax.add_patch(FancyBboxPatch((0.6, y_pos-0.15), 0.5, 0.25, 
-                                    boxstyle="round,pad=0.02", 
-                                    facecolor='white', edgecolor=bronze_color, linewidth=1.5))
-        ax.text(0.85, y_pos, source, fontsize=8, ha='center', va='center', fontweight='bold')
-        ax.text(2.2, y_pos, desc, fontsize=7, ha='left', va='center')
+    bronze_ys = bronze_y - 0.3 - np.arange(len(bronze_sources)) * 0.35
+    _add_boxes(ax, [(0.6, y - 0.15, 0.5, 0.25) for y in bronze_ys],
+               "round,pad=0.02", facecolors='white', edgecolors=bronze_color, linewidths=1.5)
+    for y_pos, (source, desc) in zip(bronze_ys, bronze_sources):
+        ax.text(0.85, y_pos, source, fontproperties=_font(8, 'bold'), ha='center', va='center')
+        ax.text(2.2, y_pos, desc, fontproperties=_font(7), ha='left', va='center')
     
     # ===== SILVER LAYER =====
-    silver_y = 7.5
-    ax.add_patch(FancyBboxPatch((3.5, silver_y-0.8), 2.5, 1.6, 
-                                boxstyle="round,pad=0.1", 
-                                facecolor=silver_color, edgecolor='black', linewidth=2, alpha=0.3))
     ax.text(4.75, silver_y+0.5, 'SILVER LAYER', fontsize=14, fontweight='bold', ha='center')
     ax.text(4.75, silver_y+0.1, 'Cleaned & Validated', fontsize=10, ha='center', style='italic')
     
@@ -71,18 +156,13 @@ def create_medallion_architecture_diagram(output_path: Path):
         'Daily interpolation'
     ]
     
-    for i, step in enumerate(silver_steps):
-        y_pos = silver_y - 0.3 - i*0.35
-        ax.add_patch(FancyBboxPatch((3.6, y_pos-0.12), 0.8, 0.2, 
-                                    boxstyle="round,pad=0.02", 
-                                    facecolor='white', edgecolor=silver_color, linewidth=1.5))
-        ax.text(4.0, y_pos, step, fontsize=7, ha='center', va='center')
+    silver_ys = silver_y - 0.3 - np.arange(len(silver_steps)) * 0.35
+    _add_boxes(ax, [(3.6, y - 0.12, 0.8, 0.2) for y in silver_ys],
+               "round,pad=0.02", facecolors='white', edgecolors=silver_color, linewidths=1.5)
+    for y_pos, step in zip(silver_ys, silver_steps):
+        ax.text(4.0, y_pos, step, fontproperties=_font(7), ha='center', va='center')
     
     # ===== GOLD LAYER =====
-    gold_y = 7.5
-    ax.add_patch(FancyBboxPatch((6.5, gold_y-0.8), 2.5, 1.6, 
-                                boxstyle="round,pad=0.1", 
-                                facecolor=gold_color, edgecolor='black', linewidth=2, alpha=0.3))
     ax.text(7.75, gold_y+0.5, 'GOLD LAYER', fontsize=14, fontweight='bold', ha='center')
     ax.text(7.75, gold_y+0.1, 'Model-Ready Features', fontsize=10, ha='center', style='italic')
     
@@ -94,17 +174,15 @@ def create_medallion_architecture_diagram(output_path: Path):
         'Interaction terms'
     ]
     
-    for i, feature in enumerate(gold_features):
-        y_pos = gold_y - 0.3 - i*0.35
-        ax.add_patch(FancyBboxPatch((6.6, y_pos-0.12), 0.9, 0.2, 
-                                    boxstyle="round,pad=0.02", 
-                                    facecolor='white', edgecolor=gold_color, linewidth=1.5))
-        ax.text(7.05, y_pos, feature, fontsize=7, ha='center', va='center')
+    gold_ys = gold_y - 0.3 - np.arange(len(gold_features)) * 0.35
+    _add_boxes(ax, [(6.6, y - 0.12, 0.9, 0.2) for y in gold_ys],
+               "round,pad=0.02", facecolors='white', edgecolors=gold_color, linewidths=1.5)
+    for y_pos, feature in zip(gold_ys, gold_features):
+        ax.text(7.05, y_pos, feature, fontproperties=_font(7), ha='center', va='center')
     
     # Arrows between layers
-    arrow_props = dict(arrowstyle='->', lw=3, color='black')
-    ax.annotate('', xy=(3.5, bronze_y), xytext=(3.0, bronze_y), arrowprops=arrow_props)
-    ax.annotate('', xy=(6.5, silver_y), xytext=(6.0, silver_y), arrowprops=arrow_props)
+    _add_arrows(ax, [(3.0, bronze_y), (6.0, silver_y)], [(3.5, bronze_y), (6.5, silver_y)],
+                linewidths=3, colors='black')
     
     # ===== DOWNSTREAM USAGE =====
     downstream_y = 4.5
@@ -119,15 +197,14 @@ def create_medallion_architecture_diagram(output_path: Path):
         ('SHAP\nAnalysis', 8, downstream_y)
     ]
     
+    _add_boxes(ax, [(x-0.5, y-0.3, 1, 0.6) for _, x, y in models],
+               "round,pad=0.05", facecolors='#E8F4F8', edgecolors='#2E86AB', linewidths=2)
     for name, x, y in models:
-        ax.add_patch(FancyBboxPatch((x-0.5, y-0.3), 1, 0.6, 
-                                    boxstyle="round,pad=0.05", 
-                                    facecolor='#E8F4F8', edgecolor='#2E86AB', linewidth=2))
-        ax.text(x, y, name, fontsize=9, ha='center', va='center', fontweight='bold')
-        
-        # Arrow from gold to model
-        ax.annotate('', xy=(x, y+0.3), xytext=(7.75, gold_y-0.9), 
-                   arrowprops=dict(arrowstyle='->', lw=1.5, color='gray', alpha=0.6))
+        ax.text(x, y, name, fontproperties=_font(9, 'bold'), ha='center', va='center')
+    
+    # Arrows from gold to each model
+    _add_arrows(ax, [(7.75, gold_y-0.9)] * len(models), [(x, y+0.3) for _, x, y in models],
+                linewidths=1.5, colors='gray', alpha=0.6)
     
     # ===== DATA QUALITY METRICS =====
     metrics_y = 2.5
@@ -141,13 +218,12 @@ def create_medallion_architecture_diagram(output_path: Path):
         ('163 Oct rows', 'Training data')
     ]
     
-    for i, (value, label) in enumerate(metrics):
-        x_pos = 2 + i*1.8
-        ax.add_patch(FancyBboxPatch((x_pos-0.4, metrics_y-0.25), 0.8, 0.5, 
-                                    boxstyle="round,pad=0.03", 
-                                    facecolor='#D5F4E6', edgecolor='#27AE60', linewidth=1.5))
-        ax.text(x_pos, metrics_y+0.05, value, fontsize=10, ha='center', va='center', fontweight='bold')
-        ax.text(x_pos, metrics_y-0.12, label, fontsize=7, ha='center', va='center')
+    metrics_xs = 2 + np.arange(len(metrics)) * 1.8
+    _add_boxes(ax, [(x - 0.4, metrics_y-0.25, 0.8, 0.5) for x in metrics_xs],
+               "round,pad=0.03", facecolors='#D5F4E6', edgecolors='#27AE60', linewidths=1.5)
+    for x_pos, (value, label) in zip(metrics_xs, metrics):
+        ax.text(x_pos, metrics_y+0.05, value, fontproperties=_font(10, 'bold'), ha='center', va='center')
+        ax.text(x_pos, metrics_y-0.12, label, fontproperties=_font(7), ha='center', va='center')
     
     # ===== FOOTER INFO =====
     footer_text = (
@@ -157,19 +233,13 @@ def create_medallion_architecture_diagram(output_path: Path):
     ax.text(5, 0.5, footer_text, fontsize=8, ha='center', va='center', 
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"✓ Saved medallion architecture diagram to {output_path}")
+    return fig
 
 
-def create_feature_engineering_flowchart(output_path: Path):
+def create_feature_engineering_flowchart(fig: Optional[Figure] = None) -> Figure:
     """Visualize the feature engineering process."""
     
-    fig, ax = plt.subplots(figsize=(14, 12))
-    ax.set_xlim(0, 10)
-    ax.set_ylim(0, 12)
-    ax.axis('off')
+    fig, ax = _diagram_axes(fig, (14, 12), 10, 12)
     
     # Title
     ax.text(5, 11.5, 'Feature Engineering Pipeline', 
@@ -243,21 +313,20 @@ def create_feature_engineering_flowchart(output_path: Path):
         }
     ]
     
+    # Category boxes
+    _add_boxes(ax, [(1, cat['y']-0.6, 8, 1.2) for cat in categories],
+               "round,pad=0.1", facecolors=[cat['color'] for cat in categories],
+               edgecolors='black', linewidths=2, alpha=0.2)
+    
     for cat in categories:
-        # Category box
-        ax.add_patch(FancyBboxPatch((1, cat['y']-0.6), 8, 1.2, 
-                                    boxstyle="round,pad=0.1", 
-                                    facecolor=cat['color'], edgecolor='black', 
-                                    linewidth=2, alpha=0.2))
-        
         # Category title
         ax.text(5, cat['y']+0.4, cat['name'], 
-                fontsize=13, fontweight='bold', ha='center', color=cat['color'])
+                fontproperties=_font(13, 'bold'), ha='center', color=cat['color'])
         
         # Features list
         features_text = '\n'.join([f"• {f}" for f in cat['features']])
         ax.text(5, cat['y']-0.15, features_text, 
-                fontsize=8, ha='center', va='center', family='monospace')
+                fontproperties=_font(8, family='monospace'), ha='center', va='center')
     
     # Processing steps annotations
     processing_steps = [
@@ -269,11 +338,10 @@ def create_feature_engineering_flowchart(output_path: Path):
         (0.5, 1.3, 'Output:\nModel\nready')
     ]
     
+    _add_circles(ax, [x for x, _, _ in processing_steps], [y for _, y, _ in processing_steps], 0.25,
+                 facecolors='#ECF0F1', edgecolors='#7F8C8D', linewidths=1.5)
     for x, y, text in processing_steps:
-        ax.add_patch(mpatches.Circle((x, y), 0.25, facecolor='#ECF0F1', 
-                                    edgecolor='#7F8C8D', linewidth=1.5))
-        ax.text(x, y, text, fontsize=6, ha='center', va='center', 
-                fontweight='bold', color='#2C3E50')
+        ax.text(x, y, text, fontproperties=_font(6, 'bold'), ha='center', va='center', color='#2C3E50')
     
     # Academic foundations sidebar
     ax.add_patch(FancyBboxPatch((9.2, 2), 0.7, 8, boxstyle="round,pad=0.05",
@@ -283,24 +351,17 @@ def create_feature_engineering_flowchart(output_path: Path):
     
     papers = ['Borenstein\n2002', 'Kilian\n2014', 'Hamilton\n2009', 
               'Patton\n2006', 'Bacon\n1991']
-    for i, paper in enumerate(papers):
-        y_pos = 8.5 - i*1.5
-        ax.text(9.55, y_pos, paper, fontsize=6, ha='center', rotation=90, 
+    for y_pos, paper in zip(8.5 - np.arange(len(papers)) * 1.5, papers):
+        ax.text(9.55, y_pos, paper, fontproperties=_font(6), ha='center', rotation=90, 
                 bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8))
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"✓ Saved feature engineering flowchart to {output_path}")
+    return fig
 
 
-def create_model_training_workflow(output_path: Path):
+def create_model_training_workflow(fig: Optional[Figure] = None) -> Figure:
     """Visualize the model training and validation workflow."""
     
-    fig, ax = plt.subplots(figsize=(16, 10))
-    ax.set_xlim(0, 10)
-    ax.set_ylim(0, 10)
-    ax.axis('off')
+    fig, ax = _diagram_axes(fig, (16, 10), 10, 10)
     
     # Title
     ax.text(5, 9.5, 'Model Training & Validation Workflow', 
@@ -355,43 +416,45 @@ def create_model_training_workflow(output_path: Path):
         }
     ]
     
+    # Step centres, shared by every track
+    step_ys = track_y - 0.5 - np.arange(max(len(track['steps']) for track in tracks)) * 1.0
+    
+    # Track containers and step boxes
+    _add_boxes(ax, [(track['x']-0.7, 2.5, 1.4, track_height) for track in tracks],
+               "round,pad=0.1", facecolors=[track['color'] for track in tracks],
+               edgecolors='black', linewidths=2, alpha=0.15)
+    _add_boxes(ax, [(track['x']-0.6, y - 0.35, 1.2, 0.7)
+                    for track in tracks for y in step_ys[:len(track['steps'])]],
+               "round,pad=0.05", facecolors='white',
+               edgecolors=[track['color'] for track in tracks for _ in track['steps']],
+               linewidths=1.5)
+    
+    # Step-number badges
+    _add_circles(ax, [track['x']-0.5 for track in tracks for _ in track['steps']],
+                 [y+0.2 for track in tracks for y in step_ys[:len(track['steps'])]], 0.12,
+                 facecolors=[track['color'] for track in tracks for _ in track['steps']],
+                 edgecolors='white', linewidths=1)
+    
     for track in tracks:
-        # Track container
-        ax.add_patch(FancyBboxPatch((track['x']-0.7, 2.5), 1.4, track_height, 
-                                    boxstyle="round,pad=0.1", 
-                                    facecolor=track['color'], edgecolor='black', 
-                                    linewidth=2, alpha=0.15))
-        
         # Track title
         ax.text(track['x'], track_y+0.2, track['name'], 
-                fontsize=11, fontweight='bold', ha='center', color=track['color'])
+                fontproperties=_font(11, 'bold'), ha='center', color=track['color'])
         
         # Processing steps
-        for i, (step, detail) in enumerate(track['steps']):
-            y_pos = track_y - 0.5 - i*1.0
-            
-            # Step box
-            ax.add_patch(FancyBboxPatch((track['x']-0.6, y_pos-0.35), 1.2, 0.7, 
-                                        boxstyle="round,pad=0.05", 
-                                        facecolor='white', edgecolor=track['color'], 
-                                        linewidth=1.5))
-            
+        for i, (y_pos, (step, detail)) in enumerate(zip(step_ys, track['steps'])):
             # Step number
-            ax.add_patch(mpatches.Circle((track['x']-0.5, y_pos+0.2), 0.12, 
-                                        facecolor=track['color'], edgecolor='white', linewidth=1))
             ax.text(track['x']-0.5, y_pos+0.2, str(i+1), 
-                   fontsize=8, ha='center', va='center', color='white', fontweight='bold')
+                   fontproperties=_font(8, 'bold'), ha='center', va='center', color='white')
             
             # Step text
             ax.text(track['x'], y_pos+0.15, step, 
-                   fontsize=9, ha='center', va='center', fontweight='bold')
+                   fontproperties=_font(9, 'bold'), ha='center', va='center')
             ax.text(track['x'], y_pos-0.1, detail, 
-                   fontsize=7, ha='center', va='center', style='italic')
+                   fontproperties=_font(7, style='italic'), ha='center', va='center')
     
     # Arrow from prep to tracks
-    for track in tracks:
-        ax.annotate('', xy=(track['x'], track_y+0.4), xytext=(track['x'], prep_y-0.5), 
-                   arrowprops=dict(arrowstyle='->', lw=2, color='gray'))
+    _add_arrows(ax, [(track['x'], prep_y-0.5) for track in tracks],
+                [(track['x'], track_y+0.4) for track in tracks], linewidths=2, colors='gray')
     
     # ===== OUTPUT & EVALUATION =====
     output_y = 1.2
@@ -413,24 +476,16 @@ def create_model_training_workflow(output_path: Path):
     ax.text(5, output_y-0.15, output_text, fontsize=8, ha='center')
     
     # Arrows to output
-    for track in tracks:
-        ax.annotate('', xy=(5, output_y+0.5), xytext=(track['x'], 2.5), 
-                   arrowprops=dict(arrowstyle='->', lw=1.5, color='gray', alpha=0.6))
+    _add_arrows(ax, [(track['x'], 2.5) for track in tracks], [(5, output_y+0.5)] * len(tracks),
+                linewidths=1.5, colors='gray', alpha=0.6)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"✓ Saved model training workflow to {output_path}")
+    return fig
 
 
-def create_system_overview_diagram(output_path: Path):
+def create_system_overview_diagram(fig: Optional[Figure] = None) -> Figure:
     """Create a comprehensive system overview showing all components."""
     
-    fig = plt.figure(figsize=(18, 12))
-    ax = fig.add_subplot(111)
-    ax.set_xlim(0, 18)
-    ax.set_ylim(0, 12)
-    ax.axis('off')
+    fig, ax = _diagram_axes(fig, (18, 12), 18, 12)
     
     # Main title
     ax.text(9, 11.5, 'Complete System Architecture', 
@@ -449,13 +504,12 @@ def create_system_overview_diagram(output_path: Path):
         ('EIA Retail', 15, '#CD7F32', 'Weekly\nPrices')
     ]
     
+    _add_boxes(ax, [(x-1, layer1_y-0.5, 2, 1) for _, x, _, _ in sources],
+               "round,pad=0.1", facecolors=[color for _, _, color, _ in sources],
+               edgecolors='black', linewidths=2, alpha=0.3)
     for name, x, color, details in sources:
-        ax.add_patch(FancyBboxPatch((x-1, layer1_y-0.5), 2, 1, 
-                                    boxstyle="round,pad=0.1", 
-                                    facecolor=color, edgecolor='black', 
-                                    linewidth=2, alpha=0.3))
-        ax.text(x, layer1_y+0.2, name, fontsize=11, ha='center', fontweight='bold')
-        ax.text(x, layer1_y-0.2, details, fontsize=8, ha='center')
+        ax.text(x, layer1_y+0.2, name, fontproperties=_font(11, 'bold'), ha='center')
+        ax.text(x, layer1_y-0.2, details, fontproperties=_font(8), ha='center')
     
     # ===== LAYER 2: MEDALLION ARCHITECTURE =====
     layer2_y = 7
@@ -468,23 +522,21 @@ def create_system_overview_diagram(output_path: Path):
         ('Gold', 15, '#FFD700', 'Model-Ready\n22 Features')
     ]
     
+    _add_boxes(ax, [(x-1.2, layer2_y-0.5, 2.4, 1) for _, x, _, _ in medallion],
+               "round,pad=0.1", facecolors=[color for _, _, color, _ in medallion],
+               edgecolors='black', linewidths=2, alpha=0.4)
     for name, x, color, desc in medallion:
-        ax.add_patch(FancyBboxPatch((x-1.2, layer2_y-0.5), 2.4, 1, 
-                                    boxstyle="round,pad=0.1", 
-                                    facecolor=color, edgecolor='black', 
-                                    linewidth=2, alpha=0.4))
-        ax.text(x, layer2_y+0.2, name, fontsize=12, ha='center', fontweight='bold')
-        ax.text(x, layer2_y-0.2, desc, fontsize=9, ha='center')
-        
-        # Arrows between stages
-        if x < 15:
-            ax.annotate('', xy=(x+2.5, layer2_y), xytext=(x+1.3, layer2_y), 
-                       arrowprops=dict(arrowstyle='->', lw=3, color='black'))
+        ax.text(x, layer2_y+0.2, name, fontproperties=_font(12, 'bold'), ha='center')
+        ax.text(x, layer2_y-0.2, desc, fontproperties=_font(9), ha='center')
+    
+    # Arrows between stages
+    stage_xs = [x for _, x, _, _ in medallion if x < 15]
+    _add_arrows(ax, [(x+1.3, layer2_y) for x in stage_xs], [(x+2.5, layer2_y) for x in stage_xs],
+                linewidths=3, colors='black')
     
     # Arrows from sources to bronze
-    for _, x, _, _ in sources:
-        ax.annotate('', xy=(3, layer2_y+0.5), xytext=(x, layer1_y-0.5), 
-                   arrowprops=dict(arrowstyle='->', lw=1.5, color='gray', alpha=0.6))
+    _add_arrows(ax, [(x, layer1_y-0.5) for _, x, _, _ in sources], [(3, layer2_y+0.5)] * len(sources),
+                linewidths=1.5, colors='gray', alpha=0.6)
     
     # ===== LAYER 3: FEATURE ENGINEERING =====
     layer3_y = 4.8
@@ -500,16 +552,14 @@ def create_system_overview_diagram(output_path: Path):
         ('Target\n(2)', 16, '#34495E')
     ]
     
+    _add_boxes(ax, [(x-0.6, layer3_y-0.4, 1.2, 0.8) for _, x, _ in feature_groups],
+               "round,pad=0.05", facecolors=[color for _, _, color in feature_groups],
+               edgecolors='black', linewidths=1.5, alpha=0.3)
     for name, x, color in feature_groups:
-        ax.add_patch(FancyBboxPatch((x-0.6, layer3_y-0.4), 1.2, 0.8, 
-                                    boxstyle="round,pad=0.05", 
-                                    facecolor=color, edgecolor='black', 
-                                    linewidth=1.5, alpha=0.3))
-        ax.text(x, layer3_y, name, fontsize=9, ha='center', va='center', fontweight='bold')
+        ax.text(x, layer3_y, name, fontproperties=_font(9, 'bold'), ha='center', va='center')
     
     # Arrow from gold to features
-    ax.annotate('', xy=(9, layer3_y+0.5), xytext=(15, layer2_y-0.5), 
-               arrowprops=dict(arrowstyle='->', lw=2, color='black'))
+    _add_arrows(ax, [(15, layer2_y-0.5)], [(9, layer3_y+0.5)], linewidths=2, colors='black')
     
     # ===== LAYER 4: MODELING =====
     layer4_y = 2.8
@@ -523,17 +573,16 @@ def create_system_overview_diagram(output_path: Path):
         ('SHAP\nAnalysis', 15, '#27AE60', 'Interpretability')
     ]
     
+    _add_boxes(ax, [(x-1, layer4_y-0.4, 2, 0.8) for _, x, _, _ in models],
+               "round,pad=0.05", facecolors=[color for _, _, color, _ in models],
+               edgecolors='black', linewidths=2, alpha=0.3)
     for name, x, color, metric in models:
-        ax.add_patch(FancyBboxPatch((x-1, layer4_y-0.4), 2, 0.8, 
-                                    boxstyle="round,pad=0.05", 
-                                    facecolor=color, edgecolor='black', 
-                                    linewidth=2, alpha=0.3))
-        ax.text(x, layer4_y+0.1, name, fontsize=9, ha='center', fontweight='bold')
-        ax.text(x, layer4_y-0.2, metric, fontsize=7, ha='center', style='italic')
-        
-        # Arrow from features to model
-        ax.annotate('', xy=(x, layer4_y+0.4), xytext=(9, layer3_y-0.5), 
-                   arrowprops=dict(arrowstyle='->', lw=1.5, color='gray', alpha=0.5))
+        ax.text(x, layer4_y+0.1, name, fontproperties=_font(9, 'bold'), ha='center')
+        ax.text(x, layer4_y-0.2, metric, fontproperties=_font(7, style='italic'), ha='center')
+    
+    # Arrows from features to each model
+    _add_arrows(ax, [(9, layer3_y-0.5)] * len(models), [(x, layer4_y+0.4) for _, x, _, _ in models],
+                linewidths=1.5, colors='gray', alpha=0.5)
     
     # ===== LAYER 5: OUTPUT =====
     layer5_y = 1
@@ -545,9 +594,8 @@ def create_system_overview_diagram(output_path: Path):
             fontsize=9, ha='center')
     
     # Arrows to output
-    for _, x, _, _ in models:
-        ax.annotate('', xy=(9, layer5_y+0.5), xytext=(x, layer4_y-0.5), 
-                   arrowprops=dict(arrowstyle='->', lw=1.5, color='gray', alpha=0.5))
+    _add_arrows(ax, [(x, layer4_y-0.5) for _, x, _, _ in models], [(9, layer5_y+0.5)] * len(models),
+                linewidths=1.5, colors='gray', alpha=0.5)
     
     # ===== SIDE INFO PANEL =====
     ax.add_patch(FancyBboxPatch((0.3, 3), 1.5, 6, boxstyle="round,pad=0.1",
@@ -564,15 +612,62 @@ def create_system_overview_diagram(output_path: Path):
         ('Runtime', '~25 sec')
     ]
     
-    for i, (label, value) in enumerate(stats):
-        y_pos = 8.2 - i*0.8
-        ax.text(0.6, y_pos, label, fontsize=8, ha='left', fontweight='bold')
-        ax.text(1.5, y_pos, value, fontsize=8, ha='right', color='#E74C3C')
+    for y_pos, (label, value) in zip(8.2 - np.arange(len(stats)) * 0.8, stats):
+        ax.text(0.6, y_pos, label, fontproperties=_font(8, 'bold'), ha='left')
+        ax.text(1.5, y_pos, value, fontproperties=_font(8), ha='right', color='#E74C3C')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    print(f"✓ Saved system overview diagram to {output_path}")
+    return fig
+
+
+def _render_rgba(fig: Figure, dpi: int) -> np.ndarray:
+    """Draw ``fig`` at ``dpi`` and return a copy of its pixels, freeing the figure for reuse."""
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    return np.array(fig.canvas.buffer_rgba())
+
+
+def _write_png(rgba: np.ndarray, output_path: Path, dpi: int) -> None:
+    """Encode rendered pixels to ``output_path``; zlib releases the GIL while it runs."""
+    Image.fromarray(rgba).save(output_path, format='png', dpi=(dpi, dpi), **PNG_PIL_KWARGS)
+    print(f"✓ Saved {output_path}")
+
+
+def _source_digest(create_fn, dpi: int) -> str:
+    """Fingerprint of a diagram builder's source, the shared drawing helpers and the output dpi."""
+    h = hashlib.blake2b(digest_size=8)
+    for fn in (create_fn, _diagram_axes, _font, _add_boxes, _add_circles, _add_arrows,
+               _render_rgba, _write_png):
+        h.update(inspect.getsource(fn).encode())
+    h.update(str(dpi).encode())
+    return h.hexdigest()
+
+
+def _is_current(create_fn, output_path: Path, dpi: int) -> bool:
+    """True if ``output_path`` exists and its .stamp matches the builder's source digest."""
+    stamp = output_path.with_suffix('.stamp')
+    return output_path.exists() and stamp.exists() and stamp.read_text().strip() == _source_digest(create_fn, dpi)
+
+
+@lru_cache(maxsize=None)
+def _worker_figure() -> Figure:
+    """One figure per process, reused for every diagram that process renders."""
+    return plt.figure(figsize=(18, 12))
+
+
+def _run(tasks):
+    """Process-pool entry point: render a batch of ``(create_fn, output_path, dpi)`` tasks.
+
+    Drawing stays on this thread (matplotlib is not thread-safe), but each PNG
+    is encoded on a background thread while the next diagram is laid out.
+    """
+    fig = _worker_figure()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(_write_png, _render_rgba(create_fn(fig), dpi), output_path, dpi)
+                   for create_fn, output_path, dpi in tasks]
+        for future in futures:
+            future.result()
+    for create_fn, output_path, dpi in tasks:
+        output_path.with_suffix('.stamp').write_text(_source_digest(create_fn, dpi))
 
 
 def main():
@@ -585,11 +680,27 @@ def main():
     print("🎨 GENERATING SYSTEM ARCHITECTURE VISUALIZATIONS")
     print("="*70 + "\n")
     
-    # Generate all diagrams
-    create_medallion_architecture_diagram(output_dir / "01_medallion_architecture.png")
-    create_feature_engineering_flowchart(output_dir / "02_feature_engineering.png")
-    create_model_training_workflow(output_dir / "03_model_training_workflow.png")
-    create_system_overview_diagram(output_dir / "04_system_overview.png")
+    tasks = [
+        (create_medallion_architecture_diagram, output_dir / "01_medallion_architecture.png", DIAGRAM_DPI),
+        (create_feature_engineering_flowchart, output_dir / "02_feature_engineering.png", DIAGRAM_DPI),
+        (create_model_training_workflow, output_dir / "03_model_training_workflow.png", DIAGRAM_DPI),
+        (create_system_overview_diagram, output_dir / "04_system_overview.png", OVERVIEW_DPI),
+    ]
+    # The diagrams are static, so only redraw those whose builder code changed
+    pending = []
+    for task in tasks:
+        if _is_current(*task):
+            print(f"✓ Up to date, skipping {task[1].name}")
+        else:
+            pending.append(task)
+    
+    # Diagrams are independent and CPU-bound in Agg, so render them in separate
+    # processes; with fewer cores than diagrams a worker takes several and
+    # overlaps each PNG encode with the next layout
+    if pending:
+        n_workers = min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(_run, [pending[i::n_workers] for i in range(n_workers)]))
     
     print("\n" + "="*70)
     print(f"✓ All visualizations saved to {output_dir}")
@@ -8,12 +8,23 @@ years, producing metrics, prediction traces, and summary plots.
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
 import sys
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
+from joblib import Parallel, delayed
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.dates as mdates  # noqa: E402
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.collections import LineCollection  # noqa: E402
+from matplotlib.lines import Line2D  # noqa: E402
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -23,7 +34,6 @@ if str(SRC_DIR) not in sys.path:
 
 from models.baseline_models import (  # noqa: E402
     COMMON_FEATURES,
-    compute_metrics,
     load_model_ready_dataset,
     prepare_forecast_frame,
     ridge_time_series_cv,
@@ -31,77 +41,182 @@ from models.baseline_models import (  # noqa: E402
 )
 
 
+CACHE_COLUMNS_KEY = b"walk_forward_columns"
+
+
+def _cache_is_fresh(cache_path: Path, data_path: Path, columns: List[str]) -> bool:
+    """The cache must be newer than the Gold file and hold exactly ``columns``."""
+    if not cache_path.exists() or cache_path.stat().st_mtime_ns < data_path.stat().st_mtime_ns:
+        return False
+    metadata = pq.read_schema(cache_path).metadata or {}
+    return metadata.get(CACHE_COLUMNS_KEY) == json.dumps(columns).encode()
+
+
+def load_dataset_cached(data_path: Path, cache_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Load the model-ready dataset, optionally through a pruned float32 cache.
+
+    The cache holds only date, retail_price and COMMON_FEATURES, and is rebuilt
+    whenever the Gold file is newer than it or the feature list has changed.
+    """
+    if cache_path is None:
+        return load_model_ready_dataset(data_path)
+
+    columns = ["date", "retail_price", *COMMON_FEATURES]
+    if _cache_is_fresh(cache_path, data_path, columns):
+        return pd.read_parquet(cache_path, engine="pyarrow", memory_map=True)
+
+    df = load_model_ready_dataset(data_path)
+    df = df[columns].sort_values("date", kind="stable").reset_index(drop=True)
+    numeric = df.select_dtypes(include="number").columns
+    df[numeric] = df[numeric].astype("float32")
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), CACHE_COLUMNS_KEY: json.dumps(columns).encode()}
+    )
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, cache_path, use_dictionary=True, compression="zstd")
+    print(f"✓ Cached model-ready dataset to {cache_path}")
+    return df
+
+
+def fold_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    """
+    Array version of ``compute_metrics`` (same keys) for the per-fold loop.
+
+    The residual is formed once and the squared sums are dot products, so
+    only the residual and its absolute value are materialised. Non-finite
+    pairs are dropped; metrics with no defined value come back as NaN.
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+    valid = np.isfinite(y_true) & np.isfinite(y_pred)
+    if not valid.all():
+        y_true, y_pred = y_true[valid], y_pred[valid]
+
+    n = y_true.size
+    if n == 0:
+        return {"rmse": float("nan"), "mae": float("nan"), "r2": float("nan"), "mape_pct": float("nan")}
+
+    resid = y_true - y_pred
+    abs_resid = np.abs(resid)
+    centered = y_true - y_true.mean()
+    sse = float(resid @ resid)
+    sst = float(centered @ centered)
+    # MAPE skips zero targets and is undefined when every target is zero
+    nonzero = y_true != 0
+    n_nonzero = int(nonzero.sum())
+    if n_nonzero:
+        mape_pct = float(abs_resid[nonzero] @ (1.0 / np.abs(y_true[nonzero]))) / n_nonzero * 100.0
+    else:
+        mape_pct = float("nan")
+
+    return {
+        "rmse": float(np.sqrt(sse / n)),
+        "mae": float(abs_resid.sum() / n),
+        "r2": 1.0 - sse / sst if sst > 0 else float("nan"),
+        "mape_pct": mape_pct,
+    }
+
+
+def _run_fold(train_df: pd.DataFrame, X_test: pd.DataFrame) -> Tuple[Dict[str, object], np.ndarray]:
+    """Tune alpha, fit and predict one (horizon, year) fold. Runs in a worker."""
+    cv_results = ridge_time_series_cv(train_df, COMMON_FEATURES, "target")
+    model = train_ridge_model(train_df, COMMON_FEATURES, target="target", alpha=cv_results["best_alpha"])
+    return cv_results, model.predict(X_test)
+
+
 def walk_forward_forecasts(
     df: pd.DataFrame,
     horizons: Iterable[int],
     years: Iterable[int],
     output_dir: Path,
+    n_jobs: int = -1,
 ) -> Dict[str, pd.DataFrame]:
     output_dir.mkdir(parents=True, exist_ok=True)
     metrics_records = []
-    prediction_records = []
+    prediction_frames: List[pd.DataFrame] = []
+    cv_frames: Dict[Path, List[pd.DataFrame]] = {}
+    folds = []
 
     for horizon in horizons:
         df_h = prepare_forecast_frame(df, horizon)
-        target_col = "target"
+        df_h = df_h.sort_values("target_date", kind="stable").reset_index(drop=True)
+        target_dates = df_h["target_date"].to_numpy(dtype="datetime64[ns]")
+        # Only the model columns go to the workers; fits stay in float64 even
+        # when the frame came from the float32 cache
+        model_frame = df_h[[*COMMON_FEATURES, "target"]].astype(np.float64)
         horizon_dir = output_dir / f"horizon_{horizon}"
         horizon_dir.mkdir(parents=True, exist_ok=True)
 
         for year in years:
-            start = pd.Timestamp(f"{year}-10-01")
-            end = pd.Timestamp(f"{year}-10-31")
-
-            train_mask = df_h["target_date"] < start
-            test_mask = (df_h["target_date"] >= start) & (df_h["target_date"] <= end)
+            start = np.datetime64(f"{year}-10-01", "ns")
+            end = np.datetime64(f"{year}-10-31", "ns")
 
-            train_df = df_h.loc[train_mask].copy()
-            test_df = df_h.loc[test_mask].copy()
+            # df_h is sorted by target_date, so each split is a contiguous slice
+            split = int(np.searchsorted(target_dates, start, side="left"))
+            stop = int(np.searchsorted(target_dates, end, side="right"))
 
-            if len(train_df) < 200 or test_df.empty:
+            if split < 200 or stop == split:
                 continue
 
-            cv_results = ridge_time_series_cv(train_df, COMMON_FEATURES, target_col)
-            best_alpha = cv_results["best_alpha"]
-            if not cv_results["summary"].empty:
-                cv_results["summary"].to_csv(
-                    horizon_dir / f"ridge_cv_summary_{year}.csv",
-                    index=False,
+            test_df = df_h.iloc[split:stop]
+            folds.append(
+                (
+                    horizon,
+                    year,
+                    horizon_dir,
+                    test_df,
+                    model_frame.iloc[:split],
+                    model_frame.iloc[split:stop][COMMON_FEATURES],
                 )
+            )
 
-            model = train_ridge_model(train_df, COMMON_FEATURES, target=target_col, alpha=best_alpha)
-            preds = model.predict(test_df[COMMON_FEATURES])
+    # Folds are independent; loky memory-maps the larger training frames for workers
+    results = Parallel(n_jobs=n_jobs, prefer="processes", max_nbytes="1M")(
+        delayed(_run_fold)(train_df, X_test) for *_, train_df, X_test in folds
+    )
 
-            metrics = compute_metrics(test_df[target_col], preds)
-            metrics.update(
+    for (horizon, year, horizon_dir, test_df, train_df, _), (cv_results, preds) in zip(folds, results):
+        best_alpha = cv_results["best_alpha"]
+        if not cv_results["summary"].empty:
+            cv_frames.setdefault(horizon_dir, []).append(cv_results["summary"].assign(year=year))
+
+        metrics = fold_metrics(test_df["target"].to_numpy(dtype=np.float64), preds)
+        metrics.update(
+            {
+                "year": year,
+                "horizon": horizon,
+                "best_alpha": best_alpha,
+                "n_train": len(train_df),
+                "n_test": len(test_df),
+            }
+        )
+        metrics_records.append(metrics)
+
+        prediction_frames.append(
+            pd.DataFrame(
                 {
-                    "year": year,
                     "horizon": horizon,
-                    "best_alpha": best_alpha,
-                    "n_train": len(train_df),
-                    "n_test": len(test_df),
+                    "year": year,
+                    "as_of_date": test_df["date"].to_numpy(),
+                    "target_date": test_df["target_date"].to_numpy(),
+                    "actual": test_df["target"].to_numpy(),
+                    "prediction": preds,
                 }
             )
-            metrics_records.append(metrics)
-
-            for as_of_date, target_date, actual, pred in zip(
-                test_df["date"],
-                test_df["target_date"],
-                test_df[target_col],
-                preds,
-            ):
-                prediction_records.append(
-                    {
-                        "horizon": horizon,
-                        "year": year,
-                        "as_of_date": as_of_date,
-                        "target_date": target_date,
-                        "actual": actual,
-                        "prediction": pred,
-                    }
-                )
+        )
+
+    # One CV summary file per horizon, with a year column, instead of one per fold
+    for horizon_dir, frames in cv_frames.items():
+        pd.concat(frames, ignore_index=True).to_parquet(
+            horizon_dir / "ridge_cv_summary_all_years.parquet",
+            index=False,
+        )
 
     metrics_df = pd.DataFrame(metrics_records)
-    predictions_df = pd.DataFrame(prediction_records)
+    predictions_df = pd.concat(prediction_frames, ignore_index=True) if prediction_frames else pd.DataFrame()
     metrics_df.to_csv(output_dir / "walk_forward_metrics.csv", index=False)
     predictions_df.to_csv(output_dir / "walk_forward_predictions.csv", index=False)
 
@@ -114,36 +229,51 @@ def plot_walk_forward(predictions_df: pd.DataFrame, output_dir: Path) -> None:
         # Optionally, create a placeholder artifact or just return
         return
 
-    for horizon in sorted(predictions_df["horizon"].unique()):
-        subset = predictions_df[predictions_df["horizon"] == horizon]
-        if subset.empty:
-            continue
+    legend_handles = [
+        Line2D([], [], color="#1ABC9C", linewidth=2, label="Actual"),
+        Line2D([], [], color="#F39C12", linewidth=1.8, linestyle="--", label="Prediction"),
+    ]
 
-        years = sorted(subset["year"].unique())
-        n_years = len(years)
+    # One figure is cleared and re-laid-out per horizon instead of rebuilt
+    fig = plt.figure()
+    for horizon, subset in predictions_df.groupby("horizon", sort=True):
+        year_groups = subset.groupby("year", sort=True)
+        n_years = year_groups.ngroups
         cols = 3
         rows = (n_years + cols - 1) // cols
-        fig, axes = plt.subplots(rows, cols, figsize=(cols * 4.5, rows * 3.5), sharey=True)
-        axes = axes.flatten()
+        fig.clear()
+        fig.set_size_inches(cols * 4.5, rows * 3.5)
+        axes = fig.subplots(rows, cols, sharey=True, squeeze=False).flatten()
 
-        for ax in axes:
+        for ax in axes[n_years:]:
             ax.set_visible(False)
 
-        for idx, year in enumerate(years):
-            ax = axes[idx]
-            ax.set_visible(True)
-            data = subset[subset["year"] == year].sort_values("target_date")
-            ax.plot(data["target_date"], data["actual"], color="#1ABC9C", linewidth=2, label="Actual")
-            ax.plot(data["target_date"], data["prediction"], color="#F39C12", linewidth=1.8, linestyle="--", label="Prediction")
+        for ax, (year, data) in zip(axes, year_groups):
+            data = data.sort_values("target_date")
+            x = mdates.date2num(data["target_date"].to_numpy())
+            # Actual and prediction share one collection artist per panel
+            lines = LineCollection(
+                [
+                    np.column_stack([x, data["actual"].to_numpy()]),
+                    np.column_stack([x, data["prediction"].to_numpy()]),
+                ],
+                colors=["#1ABC9C", "#F39C12"],
+                linewidths=[2, 1.8],
+                linestyles=["solid", "--"],
+            )
+            ax.add_collection(lines)
+            ax.xaxis_date()
+            ax.autoscale_view()
             ax.set_title(f"{year}")
             ax.grid(alpha=0.2)
             ax.tick_params(axis="x", rotation=45)
 
-        axes[0].legend(loc="upper left")
+        axes[0].legend(handles=legend_handles, loc="upper left")
         fig.suptitle(f"Walk-Forward Forecasts – Horizon {horizon} days", fontsize=16)
         fig.tight_layout(rect=[0, 0, 1, 0.96])
         fig.savefig(output_dir / f"walk_forward_h{horizon}.png", dpi=160)
-        plt.close(fig)
+
+    plt.close(fig)
 
 
 def parse_args() -> argparse.Namespace:
@@ -154,6 +284,12 @@ def parse_args() -> argparse.Namespace:
         default=Path(__file__).resolve().parents[1] / "data" / "gold" / "master_model_ready.parquet",
         help="Path to Gold model-ready dataset",
     )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=None,
+        help="Optional float32 parquet cache of the model-ready columns (rebuilt when stale)",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -174,13 +310,19 @@ def parse_args() -> argparse.Namespace:
         default=[2021, 2022, 2023, 2024],
         help="Years (October) to evaluate",
     )
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=-1,
+        help="Parallel workers for the fold loop (-1 uses all cores)",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    df = load_model_ready_dataset(args.data_path)
-    artefacts = walk_forward_forecasts(df, args.horizons, args.years, args.output_dir)
+    df = load_dataset_cached(args.data_path, args.cache_path)
+    artefacts = walk_forward_forecasts(df, args.horizons, args.years, args.output_dir, n_jobs=args.n_jobs)
     plot_walk_forward(artefacts["predictions"], args.output_dir)
     print(f"✓ Walk-forward metrics saved to {args.output_dir / 'walk_forward_metrics.csv'}")
     print(f"✓ Walk-forward plots available under {args.output_dir}")
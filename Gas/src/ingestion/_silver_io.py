@@ -0,0 +1,38 @@
+"""
+Shared frame helpers and parquet writer for the silver-layer download modules.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SILVER_DIR = Path(__file__).resolve().parents[1] / "data" / "silver"
+
+
+def save_silver(df: pd.DataFrame, filename: str) -> Path:
+    """Write ``df`` to ``SILVER_DIR / filename`` and return the path."""
+    SILVER_DIR.mkdir(parents=True, exist_ok=True)
+    path = SILVER_DIR / filename
+    # Silver frames are a date plus numeric columns; build Arrow columns straight from the arrays
+    table = pa.table({col: df[col].to_numpy() for col in df.columns})
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        compression_level=3,
+        row_group_size=131072,
+        use_dictionary=True,
+    )
+    return path
+
+
+def sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` ordered by its ``date`` column, skipping the sort when already ascending."""
+    # EIA returns periods ascending (sort[0] in default_params), so this is normally a no-op check
+    if df["date"].is_monotonic_increasing:
+        return df
+    return df.sort_values("date")
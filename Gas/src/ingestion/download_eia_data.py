@@ -4,22 +4,14 @@ Download EIA weekly petroleum data.
 
 from __future__ import annotations
 
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import pandas as pd
 
+from ._silver_io import SILVER_DIR, save_silver, sort_by_date
 from .eia_client import EIAClient, EIAClientError, default_params
 
-SILVER_DIR = Path(__file__).resolve().parents[1] / "data" / "silver"
-
-
-def _save(df: pd.DataFrame, filename: str) -> Path:
-    SILVER_DIR.mkdir(parents=True, exist_ok=True)
-    path = SILVER_DIR / filename
-    df.to_parquet(path, index=False)
-    return path
-
 
 def fetch_inventory(client: Optional[EIAClient] = None) -> pd.DataFrame:
     client = client or EIAClient()
@@ -28,9 +20,10 @@ def fetch_inventory(client: Optional[EIAClient] = None) -> pd.DataFrame:
     if df.empty:
         raise EIAClientError("Fetched inventory data is empty. No data returned from EIA API.")
     df = df.assign(
-        date=pd.to_datetime(df["period"]),
-        inventory_mbbl=df["value"].astype(float) / 1000.0,
-    )[["date", "inventory_mbbl"]].sort_values("date")
+        date=df["period"],
+        inventory_mbbl=df["value"] / 1000.0,
+    )[["date", "inventory_mbbl"]]
+    df = sort_by_date(df)
 
     if df["inventory_mbbl"].min() <= 180 or df["inventory_mbbl"].max() >= 350:
         raise EIAClientError("Inventory values outside expected range (180-350 million barrels).")
@@ -44,9 +37,10 @@ def fetch_utilization(client: Optional[EIAClient] = None) -> pd.DataFrame:
     if df.empty:
         raise EIAClientError("Fetched utilization data is empty. No data returned from EIA API.")
     df = df.assign(
-        date=pd.to_datetime(df["period"]),
-        utilization_pct=df["value"].astype(float),
-    )[["date", "utilization_pct"]].sort_values("date")
+        date=df["period"],
+        utilization_pct=df["value"],
+    )[["date", "utilization_pct"]]
+    df = sort_by_date(df)
 
     if df["utilization_pct"].min() <= 50 or df["utilization_pct"].max() >= 100:
         raise EIAClientError("Utilization percentage outside expected range (50-100%).")
@@ -55,29 +49,30 @@ def fetch_utilization(client: Optional[EIAClient] = None) -> pd.DataFrame:
 
 def fetch_net_imports(client: Optional[EIAClient] = None) -> pd.DataFrame:
     client = client or EIAClient()
-    imports_params = default_params("WGTIMUS2", frequency="weekly", start="2020-10-01")
-    exports_params = default_params("W_EPM0F_EEX_NUS-Z00_MBBLD", frequency="weekly", start="2020-10-01")
+    # Imports and exports share an endpoint, so one request returns both series
+    params = default_params(["WGTIMUS2", "W_EPM0F_EEX_NUS-Z00_MBBLD"], frequency="weekly", start="2020-10-01")
+    moves_df = client.fetch("petroleum/move/wkly/data", params)
 
-    imports_df = client.fetch("petroleum/move/wkly/data", imports_params)
-    exports_df = client.fetch("petroleum/move/wkly/data", exports_params)
+    imports_df = moves_df[moves_df["series"] == "WGTIMUS2"]
+    exports_df = moves_df[moves_df["series"] == "W_EPM0F_EEX_NUS-Z00_MBBLD"]
     if imports_df.empty:
         raise EIAClientError("Fetched imports data is empty. No data returned from EIA API.")
     if exports_df.empty:
         raise EIAClientError("Fetched exports data is empty. No data returned from EIA API.")
 
     imports = imports_df.assign(
-        date=pd.to_datetime(imports_df["period"]), imports=imports_df["value"].astype(float)
+        date=imports_df["period"], imports=imports_df["value"]
     )[["date", "imports"]]
     exports = exports_df.assign(
-        date=pd.to_datetime(exports_df["period"]), exports=exports_df["value"].astype(float)
+        date=exports_df["period"], exports=exports_df["value"]
     )[["date", "exports"]]
 
     df = (
         imports.merge(exports, on="date", how="inner")
         .assign(net_imports_kbd=lambda x: x["imports"] - x["exports"])
         [["date", "net_imports_kbd"]]
-        .sort_values("date")
     )
+    df = sort_by_date(df)
     if df.empty:
         raise EIAClientError("Merged net imports DataFrame is empty. No overlapping dates between imports and exports.")
     return df
@@ -89,17 +84,23 @@ def main() -> None:
     print("=" * 60)
 
     try:
-        inventory_df = fetch_inventory()
-        inv_path = _save(inventory_df, "eia_inventory_weekly.parquet")
-        print(f"✓ Inventory data saved to {inv_path}")
-
-        util_df = fetch_utilization()
-        util_path = _save(util_df, "eia_utilization_weekly.parquet")
-        print(f"✓ Utilization data saved to {util_path}")
-
-        imports_df = fetch_net_imports()
-        imports_path = _save(imports_df, "eia_imports_weekly.parquet")
-        print(f"✓ Net imports data saved to {imports_path}")
+        # The three downloads are independent round trips; run them concurrently.
+        # With requests-cache installed they go through the on-disk cache over
+        # HTTP/1.1 rather than multiplexing over HTTP/2 (see EIAClient._client_session)
+        client = EIAClient()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            inventory_future = executor.submit(fetch_inventory, client)
+            util_future = executor.submit(fetch_utilization, client)
+            imports_future = executor.submit(fetch_net_imports, client)
+
+            inv_path = save_silver(inventory_future.result(), "eia_inventory_weekly.parquet")
+            print(f"✓ Inventory data saved to {inv_path}")
+
+            util_path = save_silver(util_future.result(), "eia_utilization_weekly.parquet")
+            print(f"✓ Utilization data saved to {util_path}")
+
+            imports_path = save_silver(imports_future.result(), "eia_imports_weekly.parquet")
+            print(f"✓ Net imports data saved to {imports_path}")
 
     except EIAClientError as err:
         print(f"✗ EIA download failed: {err}")
@@ -13,6 +13,7 @@ This script downloads:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -22,85 +23,107 @@ import pandas as pd
 from ingestion.eia_client import EIAClient, EIAClientError, default_params
 
 BRONZE_DIR = Path(__file__).resolve().parents[1] / "data" / "bronze"
+HISTORY_START = "2020-10-01"
 
 
-def fetch_inventory_bronze(client: Optional[EIAClient] = None) -> pd.DataFrame:
+def fetch_inventory_bronze(client: Optional[EIAClient] = None, start: str = HISTORY_START) -> pd.DataFrame:
     """Fetch raw inventory data - NO TRANSFORMATIONS"""
     client = client or EIAClient()
-    params = default_params("WGTSTUS1", frequency="weekly", start="2020-10-01")
-    df = client.fetch("petroleum/stoc/wstk/data", params)
+    params = default_params("WGTSTUS1", frequency="weekly", start=start)
+    df = client.fetch("petroleum/stoc/wstk/data", params, raw=True)
     if df.empty:
         raise EIAClientError("Fetched inventory data is empty.")
     return df
 
 
-def fetch_utilization_bronze(client: Optional[EIAClient] = None) -> pd.DataFrame:
+def fetch_utilization_bronze(client: Optional[EIAClient] = None, start: str = HISTORY_START) -> pd.DataFrame:
     """Fetch raw utilization data - NO TRANSFORMATIONS"""
     client = client or EIAClient()
-    params = default_params("WPULEUS3", frequency="weekly", start="2020-10-01")
-    df = client.fetch("petroleum/pnp/wiup/data", params)
+    params = default_params("WPULEUS3", frequency="weekly", start=start)
+    df = client.fetch("petroleum/pnp/wiup/data", params, raw=True)
     if df.empty:
         raise EIAClientError("Fetched utilization data is empty.")
     return df
 
 
-def fetch_imports_bronze(client: Optional[EIAClient] = None) -> pd.DataFrame:
+def fetch_imports_bronze(client: Optional[EIAClient] = None, start: str = HISTORY_START) -> pd.DataFrame:
     """Fetch raw imports data - NO TRANSFORMATIONS"""
     client = client or EIAClient()
-    params = default_params("WGTIMUS2", frequency="weekly", start="2020-10-01")
-    df = client.fetch("petroleum/move/wkly/data", params)
+    params = default_params("WGTIMUS2", frequency="weekly", start=start)
+    df = client.fetch("petroleum/move/wkly/data", params, raw=True)
     if df.empty:
         raise EIAClientError("Fetched imports data is empty.")
     return df
 
 
-def fetch_exports_bronze(client: Optional[EIAClient] = None) -> pd.DataFrame:
+def fetch_exports_bronze(client: Optional[EIAClient] = None, start: str = HISTORY_START) -> pd.DataFrame:
     """Fetch raw exports data - NO TRANSFORMATIONS"""
     client = client or EIAClient()
-    params = default_params("W_EPM0F_EEX_NUS-Z00_MBBLD", frequency="weekly", start="2020-10-01")
-    df = client.fetch("petroleum/move/wkly/data", params)
+    params = default_params("W_EPM0F_EEX_NUS-Z00_MBBLD", frequency="weekly", start=start)
+    df = client.fetch("petroleum/move/wkly/data", params, raw=True)
     if df.empty:
         raise EIAClientError("Fetched exports data is empty.")
     return df
 
 
+def _fetch_incremental(fetch_fn, client: EIAClient, path: Path) -> pd.DataFrame:
+    """
+    Fetch a series, reusing an existing raw file so only new weeks are downloaded.
+
+    The request starts at the last stored period, so the response is never empty
+    and a revised final week replaces the cached copy.
+    """
+    if not path.exists():
+        return fetch_fn(client)
+
+    existing = pd.read_parquet(path)
+    new_rows = fetch_fn(client, start=existing["period"].max())
+    return (
+        pd.concat([existing, new_rows], ignore_index=True)
+        .drop_duplicates("period", keep="last")
+        .sort_values("period")
+        .reset_index(drop=True)
+    )
+
+
 def main() -> None:
     print("=" * 70)
     print("EIA DATA DOWNLOAD TO BRONZE LAYER")
     print("=" * 70)
 
     BRONZE_DIR.mkdir(parents=True, exist_ok=True)
-    client = EIAClient()
 
-    try:
-        # Download inventory
-        print("\n📦 Downloading gasoline inventory...")
-        inventory = fetch_inventory_bronze(client)
-        inv_path = BRONZE_DIR / "eia_inventory_raw.parquet"
-        inventory.to_parquet(inv_path, index=False)
-        print(f"✓ Inventory: {len(inventory)} records → {inv_path}")
-
-        # Download utilization
-        print("\n🏭 Downloading refinery utilization...")
-        utilization = fetch_utilization_bronze(client)
-        util_path = BRONZE_DIR / "eia_utilization_raw.parquet"
-        utilization.to_parquet(util_path, index=False)
-        print(f"✓ Utilization: {len(utilization)} records → {util_path}")
-
-        # Download imports
-        print("\n📥 Downloading imports...")
-        imports = fetch_imports_bronze(client)
-        imp_path = BRONZE_DIR / "eia_imports_raw.parquet"
-        imports.to_parquet(imp_path, index=False)
-        print(f"✓ Imports: {len(imports)} records → {imp_path}")
-
-        # Download exports
-        print("\n📤 Downloading exports...")
-        exports = fetch_exports_bronze(client)
-        exp_path = BRONZE_DIR / "eia_exports_raw.parquet"
-        exports.to_parquet(exp_path, index=False)
-        print(f"✓ Exports: {len(exports)} records → {exp_path}")
+    # Each fetch is a single network-bound GET, so run them side by side
+    tasks = {
+        "Inventory": (fetch_inventory_bronze, "eia_inventory_raw.parquet"),
+        "Utilization": (fetch_utilization_bronze, "eia_utilization_raw.parquet"),
+        "Imports": (fetch_imports_bronze, "eia_imports_raw.parquet"),
+        "Exports": (fetch_exports_bronze, "eia_exports_raw.parquet"),
+    }
+    print(f"\n📦 Downloading {', '.join(name.lower() for name in tasks)}...")
 
+    try:
+        # Cached HTTP/1.1 when requests-cache is installed, HTTP/2 otherwise
+        client = EIAClient()
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {}
+            for name, (fetch_fn, filename) in tasks.items():
+                path = BRONZE_DIR / filename
+                futures[executor.submit(_fetch_incremental, fetch_fn, client, path)] = (name, path)
+            for future in as_completed(futures):
+                name, path = futures[future]
+                df = future.result()
+                df.to_parquet(
+                    path,
+                    index=False,
+                    engine="pyarrow",
+                    compression="zstd",
+                    compression_level=3,
+                    row_group_size=131072,
+                    use_dictionary=True,
+                    write_statistics=True,
+                )
+                print(f"✓ {name}: {len(df)} records → {path}")
     except EIAClientError as err:
         print(f"✗ EIA download failed: {err}")
         return
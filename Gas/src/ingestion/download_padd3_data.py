@@ -4,54 +4,44 @@ Download PADD3 (Gulf Coast) refinery capacity share from EIA.
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from ._silver_io import save_silver
 from .eia_client import EIAClient, EIAClientError, default_params
 
-SILVER_DIR = Path(__file__).resolve().parents[1] / "data" / "silver"
-
-
-def _save(df: pd.DataFrame, filename: str) -> Path:
-    SILVER_DIR.mkdir(parents=True, exist_ok=True)
-    path = SILVER_DIR / filename
-    df.to_parquet(path, index=False)
-    return path
-
 
 def fetch_padd3_share(client: Optional[EIAClient] = None) -> pd.DataFrame:
     client = client or EIAClient()
-    padd3_params = default_params("WGTSTP31", frequency="weekly", start="2020-10-01")
-    total_params = default_params("WGTSTUS1", frequency="weekly", start="2020-10-01")
+    # Both series live on the same endpoint, so fetch them in one request
+    params = default_params(["WGTSTP31", "WGTSTUS1"], frequency="weekly", start="2020-10-01")
+    stocks_df = client.fetch("petroleum/stoc/wstk/data", params)
 
-    padd3_df = client.fetch("petroleum/stoc/wstk/data", padd3_params)
-    total_df = client.fetch("petroleum/stoc/wstk/data", total_params)
+    padd3_df = stocks_df[stocks_df["series"] == "WGTSTP31"]
+    total_df = stocks_df[stocks_df["series"] == "WGTSTUS1"]
     if padd3_df.empty:
         raise EIAClientError("Fetched PADD3 stock data is empty. No data returned from EIA API.")
     if total_df.empty:
         raise EIAClientError("Fetched total stock data is empty. No data returned from EIA API.")
 
-    padd3 = padd3_df.assign(
-        date=pd.to_datetime(padd3_df["period"]), padd3_stock=padd3_df["value"].astype(float)
-    )[["date", "padd3_stock"]]
-    total = total_df.assign(
-        date=pd.to_datetime(total_df["period"]), total_stock=total_df["value"].astype(float)
-    )[["date", "total_stock"]]
-
-    df = (
-        padd3.merge(total, on="date", how="inner")
-        .assign(padd3_share=lambda x: x["padd3_stock"] / x["total_stock"] * 100.0)
-        [["date", "padd3_share"]]
-        .sort_values("date")
+    # Inner-join on period: intersect1d returns the shared dates sorted,
+    # with positions into each series
+    periods, padd3_idx, total_idx = np.intersect1d(
+        padd3_df["period"].to_numpy(),
+        total_df["period"].to_numpy(),
+        return_indices=True,
     )
-    if df.empty:
+    if periods.size == 0:
         raise EIAClientError("Merged PADD3 share DataFrame is empty. No overlapping dates between PADD3 and total stock series.")
 
-    min_share = df["padd3_share"].min()
-    max_share = df["padd3_share"].max()
-    if min_share < 30 or max_share > 45:
+    padd3_stock = padd3_df["value"].to_numpy(dtype=np.float64)[padd3_idx]
+    total_stock = total_df["value"].to_numpy(dtype=np.float64)[total_idx]
+    share = padd3_stock / total_stock * 100.0
+    df = pd.DataFrame({"date": periods, "padd3_share": share})
+
+    if share.min() < 30 or share.max() > 45:
         raise EIAClientError("PADD3 share outside expected 30%-45% band.")
     return df
 
@@ -67,7 +57,7 @@ def main() -> None:
         print(f"✗ PADD3 download failed: {err}")
         return
 
-    path = _save(df, "padd3_share_weekly.parquet")
+    path = save_silver(df, "padd3_share_weekly.parquet")
     print("✓ PADD3 data merged and saved")
     print(f"Records: {len(df)}")
     print(f"Date range: {df['date'].min():%Y-%m-%d} to {df['date'].max():%Y-%m-%d}")
@@ -16,6 +16,7 @@ Time: ~15 minutes
 Cost: FREE
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import time
@@ -24,21 +25,55 @@ import pandas as pd
 import yfinance as yf
 
 SILVER_DIR = Path(__file__).resolve().parents[1] / "data" / "silver"
+HISTORY_START = "2020-10-01"
+
+
+def _cached_history(output_path):
+    """
+    Load a previously saved series so reruns only download new days.
+
+    Returns (existing_df, start). The last stored day is re-fetched in case it
+    was saved mid-session; existing_df is None on a first download.
+    """
+    if not output_path.exists():
+        return None, HISTORY_START
+    existing = pd.read_parquet(output_path)
+    last = pd.Timestamp(existing['date'].max())
+    print(f"   Found {len(existing)} cached rows through {last.date()}")
+    return existing, last.strftime('%Y-%m-%d')
+
+
+def _merge_cached(existing, df):
+    """Append freshly downloaded rows to the cached series, newest wins."""
+    if existing is None:
+        return df
+    return (
+        pd.concat([existing, df], ignore_index=True)
+        .drop_duplicates('date', keep='last')
+        .sort_values('date')
+        .reset_index(drop=True)
+    )
 
 def download_rbob_futures():
     """Download daily RBOB gasoline futures from Yahoo Finance with retry logic"""
     
     print("Downloading RBOB futures (RB=F)...")
     
+    output_path = SILVER_DIR / 'rbob_daily.parquet'
+    existing, start = _cached_history(output_path)
+    if existing is not None and pd.Timestamp(start).date() >= pd.Timestamp.today().date():
+        print("✓ RBOB data already current")
+        return existing
+    
     # RB=F is the front-month RBOB futures contract
     ticker = yf.Ticker("RB=F")
     
-    # Download from Oct 2020 to present with retry logic
+    # Download from Oct 2020 (or the last cached day) to present with retry logic
     df = None
     max_retries = 3
     for attempt in range(1, max_retries + 1):
         try:
-            df = ticker.history(start="2020-10-01", end=pd.Timestamp.today())
+            df = ticker.history(start=start, end=pd.Timestamp.today())
             if len(df) > 0:
                 break  # Success!
             else:
@@ -67,6 +102,10 @@ def download_rbob_futures():
     # Keep only needed columns
     df = df[['date', 'price_rbob', 'volume_rbob']]
     df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)
+    # float32 covers futures quotes to well under a tenth of a cent
+    df['price_rbob'] = df['price_rbob'].astype('float32')
+    df['volume_rbob'] = df['volume_rbob'].astype('int32')
+    df = _merge_cached(existing, df)
     
     # Convert to $/gallon (Yahoo gives $/gallon already for RB=F)
     # Sanity checks
@@ -76,8 +115,7 @@ def download_rbob_futures():
     
     # Save
     SILVER_DIR.mkdir(parents=True, exist_ok=True)
-    output_path = SILVER_DIR / 'rbob_daily.parquet'
-    df.to_parquet(output_path, index=False)
+    df.to_parquet(output_path, index=False, compression='zstd', compression_level=3)
     
     print(f"✓ Downloaded {len(df)} days of RBOB data")
     print(f"  Date range: {df['date'].min().strftime('%Y-%m-%d')} to {df['date'].max().strftime('%Y-%m-%d')}")
@@ -91,6 +129,12 @@ def download_wti_futures():
     
     print("\nDownloading WTI crude futures (CL=F)...")
     
+    output_path = SILVER_DIR / 'wti_daily.parquet'
+    existing, start = _cached_history(output_path)
+    if existing is not None and pd.Timestamp(start).date() >= pd.Timestamp.today().date():
+        print("✓ WTI data already current")
+        return existing
+    
     ticker = yf.Ticker("CL=F")
     
     # Download with retry logic
@@ -98,7 +142,7 @@ def download_wti_futures():
     max_retries = 3
     for attempt in range(1, max_retries + 1):
         try:
-            df = ticker.history(start="2020-10-01", end=pd.Timestamp.today())
+            df = ticker.history(start=start, end=pd.Timestamp.today())
             if len(df) > 0:
                 break  # Success!
             else:
@@ -124,14 +168,15 @@ def download_wti_futures():
     
     df = df[['date', 'price_wti']]
     df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)
+    df['price_wti'] = df['price_wti'].astype('float32')
+    df = _merge_cached(existing, df)
     
     # Sanity checks
     assert df['price_wti'].min() > 10, f"WTI price too low: ${df['price_wti'].min():.2f}"
     assert df['price_wti'].max() < 200, f"WTI price too high: ${df['price_wti'].max():.2f}"
     assert len(df) > 1000, f"Too few observations: {len(df)}"
     
-    output_path = SILVER_DIR / 'wti_daily.parquet'
-    df.to_parquet(output_path, index=False)
+    df.to_parquet(output_path, index=False, compression='zstd', compression_level=3)
     
     print(f"✓ Downloaded {len(df)} days of WTI data")
     print(f"  Date range: {df['date'].min().strftime('%Y-%m-%d')} to {df['date'].max().strftime('%Y-%m-%d')}")
@@ -149,9 +194,12 @@ def main():
     # Check if output directory exists
     SILVER_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Download both datasets
-    rbob_df = download_rbob_futures()
-    wti_df = download_wti_futures()
+    # Download both datasets concurrently; each call is network-bound
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rbob_future = executor.submit(download_rbob_futures)
+        wti_future = executor.submit(download_wti_futures)
+        rbob_df = rbob_future.result()
+        wti_df = wti_future.result()
     
     print("\n" + "=" * 70)
     if rbob_df is not None and wti_df is not None:
@@ -12,6 +12,7 @@ Time: ~15 minutes
 Cost: FREE
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import time
@@ -21,6 +22,7 @@ import pandas as pd
 import yfinance as yf
 
 BRONZE_DIR = Path(__file__).resolve().parents[1] / "data" / "bronze"
+HISTORY_START = "2020-10-01"
 
 
 def _download_futures_bronze(
@@ -43,13 +45,26 @@ def _download_futures_bronze(
     """
     print(f"Downloading {name} futures ({symbol}) to Bronze layer...")
     
+    output_path = BRONZE_DIR / output_filename
     ticker = yf.Ticker(symbol)
     
+    # Reruns only fetch from the last stored day (re-fetched in case it was partial)
+    existing = None
+    start = HISTORY_START
+    if output_path.exists():
+        existing = pd.read_parquet(output_path)
+        last = pd.Timestamp(existing['Date'].max())
+        if last.date() >= pd.Timestamp.today().date():
+            print(f"✓ {name} data already current through {last.date()} ({output_path})")
+            return existing
+        start = last.strftime('%Y-%m-%d')
+        print(f"   Found {len(existing)} cached rows, downloading from {start}")
+    
     # Download with retry logic and exponential backoff
     df = None
     for attempt in range(1, max_retries + 1):
         try:
-            df = ticker.history(start="2020-10-01", end=pd.Timestamp.today())
+            df = ticker.history(start=start, end=pd.Timestamp.today())
             if len(df) > 0:
                 break  # Success!
             else:
@@ -68,12 +83,21 @@ def _download_futures_bronze(
         return None
     
     # Save RAW data - keep ALL columns from Yahoo Finance, NO transformations
+    # beyond storing the float64 OHLC block as float32
     df = df.reset_index()
+    float_cols = df.select_dtypes(include='float64').columns
+    df[float_cols] = df[float_cols].astype('float32')
+    if existing is not None:
+        df = (
+            pd.concat([existing, df], ignore_index=True)
+            .drop_duplicates('Date', keep='last')
+            .sort_values('Date')
+            .reset_index(drop=True)
+        )
     
     # Save to bronze
     BRONZE_DIR.mkdir(parents=True, exist_ok=True)
-    output_path = BRONZE_DIR / output_filename
-    df.to_parquet(output_path, index=False)
+    df.to_parquet(output_path, index=False, compression='zstd', compression_level=3)
     
     print(f"✓ Downloaded {len(df)} days of raw {name} data")
     print(f"  Date range: {df['Date'].min()} to {df['Date'].max()}")
@@ -111,9 +135,12 @@ def main():
     # Check if output directory exists
     BRONZE_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Download both datasets
-    rbob_df = download_rbob_futures_bronze()
-    wti_df = download_wti_futures_bronze()
+    # Download both datasets concurrently; each call is network-bound
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rbob_future = executor.submit(download_rbob_futures_bronze)
+        wti_future = executor.submit(download_wti_futures_bronze)
+        rbob_df = rbob_future.result()
+        wti_df = wti_future.result()
     
     print("\n" + "=" * 70)
     if rbob_df is not None and wti_df is not None:
@@ -4,22 +4,13 @@ Download Daily Retail Gasoline Prices from EIA.
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 
+from ._silver_io import save_silver, sort_by_date
 from .eia_client import EIAClient, EIAClientError, default_params
 
-SILVER_DIR = Path(__file__).resolve().parents[1] / "data" / "silver"
-
-
-def _save(df: pd.DataFrame, filename: str) -> Path:
-    SILVER_DIR.mkdir(parents=True, exist_ok=True)
-    path = SILVER_DIR / filename
-    df.to_parquet(path, index=False)
-    return path
-
 
 def fetch_retail_prices(client: Optional[EIAClient] = None) -> pd.DataFrame:
     """
@@ -33,24 +24,24 @@ def fetch_retail_prices(client: Optional[EIAClient] = None) -> pd.DataFrame:
     params.pop("facets[series][]", None)
     params["facets[duoarea][]"] = "NUS"
     params["facets[product][]"] = "EPMR"  # Regular gasoline
-    weekly = client.fetch("petroleum/pri/gnd/data", params)
+    weekly = client.fetch("petroleum/pri/gnd/data", params, columns=["period", "value"])
     weekly = weekly.assign(
-        date=pd.to_datetime(weekly["period"]),
-        retail_price=weekly["value"].astype(float),
-    )[["date", "retail_price"]].sort_values("date")
+        date=weekly["period"],
+        retail_price=weekly["value"],
+    )[["date", "retail_price"]]
+    # The ffill reindex below needs ascending dates
+    weekly = sort_by_date(weekly)
 
     if weekly.empty:
         raise EIAClientError("No retail gasoline data returned from EIA.")
 
+    # Pad each weekly print forward through today in a single reindex pass; the
+    # range starts at the first observation, so only gaps in the data need filling
     full_range = pd.date_range(weekly["date"].min(), pd.Timestamp.today().normalize(), freq="D")
-    daily = (
-        weekly.set_index("date")
-        .reindex(full_range)
-        .rename_axis("date")
-        .ffill()
-        .bfill()
-        .reset_index()
-    )
+    daily = weekly.set_index("date").reindex(full_range, method="ffill").rename_axis("date")
+    if daily["retail_price"].isna().any():
+        daily["retail_price"] = daily["retail_price"].ffill().bfill()
+    daily = daily.reset_index()
 
     min_price = daily["retail_price"].min()
     max_price = daily["retail_price"].max()
@@ -70,7 +61,7 @@ def main() -> None:
         print(f"✗ Retail price download failed: {err}")
         return
 
-    path = _save(df, "retail_prices_daily.parquet")
+    path = save_silver(df, "retail_prices_daily.parquet")
     print("✓ Download successful!")
     print(f"Records: {len(df)}")
     print(f"Date range: {df['date'].min():%Y-%m-%d} to {df['date'].max():%Y-%m-%d}")
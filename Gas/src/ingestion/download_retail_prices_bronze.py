@@ -31,7 +31,7 @@ def fetch_retail_prices_bronze(client: Optional[EIAClient] = None) -> pd.DataFra
     params["facets[product][]"] = "EPMR"  # Regular gasoline
     
     # Fetch raw data
-    weekly = client.fetch("petroleum/pri/gnd/data", params)
+    weekly = client.fetch("petroleum/pri/gnd/data", params, raw=True)
     
     if weekly.empty:
         raise EIAClientError("No retail gasoline data returned from EIA.")
@@ -53,7 +53,16 @@ def main() -> None:
     # Save RAW data with ALL columns from API
     BRONZE_DIR.mkdir(parents=True, exist_ok=True)
     path = BRONZE_DIR / "retail_prices_raw.parquet"
-    df.to_parquet(path, index=False)
+    df.to_parquet(
+        path,
+        index=False,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=3,
+        row_group_size=131072,
+        use_dictionary=True,
+        write_statistics=True,
+    )
     
     print("✓ Download successful!")
     print(f"Records: {len(df)}")
@@ -4,25 +4,201 @@ Lightweight EIA API client with retries and structured error handling.
 The client centralises authentication (API key), request execution, and the
 common validation logic used by the Silver-layer download scripts. This makes
 it easier to unit test downstream modules by swapping in a fake session.
+
+requests-cache only wraps requests sessions, so when it is installed the
+default client reads through the on-disk cache over HTTP/1.1 and never uses
+the httpx HTTP/2 client. Repeat runs within CACHE_EXPIRE_SECONDS then make no
+requests at all. Pass ``cache_dir=None`` to fetch live over HTTP/2 instead.
 """
 
 from __future__ import annotations
 
+import json
 import os
 import time
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Union
 
 import pandas as pd
 import requests
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# httpx (with the h2 extra) is optional; without it the client stays on requests
+try:
+    import h2  # noqa: F401
+    import httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+# requests-cache is optional; it persists responses between script runs
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# orjson is optional too; it decodes the response bytes several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_TRANSPORT_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if HTTP2_AVAILABLE else ())
+
+# Every transport retries these statuses (and connection errors) with the same backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "eia"
+# Weekly series only update on Wednesdays, so a few hours of staleness is harmless
+CACHE_EXPIRE_SECONDS = 6 * 3600
 
 
 class EIAClientError(RuntimeError):
     """Raised when the EIA API returns an unexpected response."""
 
 
+def typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parse EIA's string "period" and "value" columns in place.
+
+    value becomes float64 (nulls become NaN) and period becomes datetime64, so
+    callers do not each repeat the conversion. A value that is present but not
+    numeric raises EIAClientError rather than reaching the Silver layer as NaN.
+    """
+    if "value" in df.columns:
+        try:
+            df["value"] = pd.to_numeric(df["value"]).astype("float64")
+        except (TypeError, ValueError) as exc:
+            coerced = pd.to_numeric(df["value"], errors="coerce")
+            bad = int((coerced.isna() & df["value"].notna()).sum())
+            raise EIAClientError(f"EIA response has {bad} non-numeric value(s): {exc}") from exc
+    if "period" in df.columns:
+        df["period"] = pd.to_datetime(df["period"], format="ISO8601", cache=True)
+    return df
+
+
+@lru_cache(maxsize=64)
+def _url_for(base_url: str, endpoint: str) -> str:
+    """Join the API base and an endpoint path; scripts hit the same few endpoints."""
+    return f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+
+def _mount_retrying_adapter(session: Session, max_retries: int, backoff_factor: float) -> Session:
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET",),
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+@lru_cache(maxsize=None)
+def _shared_session(max_retries: int, backoff_factor: float) -> Session:
+    """
+    Process-wide keep-alive session for one retry policy.
+
+    Connections to api.eia.gov stay warm across EIAClient instances, and
+    connection errors and 429/5xx responses are retried with backoff by urllib3.
+    """
+    return _mount_retrying_adapter(requests.Session(), max_retries, backoff_factor)
+
+
+def _payload_rows(content: bytes) -> list:
+    """Decode an EIA body and return its ``response.data`` rows, raising EIAClientError if unusable."""
+    try:
+        payload = orjson.loads(content) if orjson is not None else json.loads(content)
+    except ValueError as exc:
+        raise EIAClientError("Failed to decode EIA response as JSON") from exc
+
+    body = payload.get("response") if isinstance(payload, dict) else None
+    if not isinstance(body, dict) or "data" not in body:
+        raise EIAClientError(f"Unexpected EIA response format: {payload}")
+
+    data = body["data"]
+    if not data:
+        raise EIAClientError("EIA response contained no rows")
+    return data
+
+
+def _has_rows(response: Response) -> bool:
+    """Cache filter: only store bodies that fetch() would accept."""
+    try:
+        _payload_rows(response.content)
+    except EIAClientError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _shared_cached_session(cache_dir: str, max_retries: int, backoff_factor: float) -> Session:
+    """
+    Like _shared_session, but responses are stored in a SQLite file under cache_dir.
+
+    The api_key parameter is left out of the cache key and the stored requests.
+    """
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    session = requests_cache.CachedSession(
+        str(Path(cache_dir) / "eia_responses"),
+        backend="sqlite",
+        expire_after=CACHE_EXPIRE_SECONDS,
+        ignored_parameters=["api_key"],
+        filter_fn=_has_rows,
+    )
+    return _mount_retrying_adapter(session, max_retries, backoff_factor)
+
+
+if HTTP2_AVAILABLE:
+
+    class _StatusRetryTransport(httpx.HTTPTransport):
+        """
+        HTTPTransport that also retries RETRY_STATUSES responses.
+
+        httpx itself only retries failed connection attempts; this applies the
+        same status policy and exponential backoff as the urllib3 Retry above.
+        """
+
+        def __init__(self, *, max_retries: int, backoff_factor: float, **kwargs) -> None:
+            super().__init__(retries=max_retries, **kwargs)
+            self._max_retries = max_retries
+            self._backoff_factor = backoff_factor
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            attempt = 0
+            while True:
+                response = super().handle_request(request)
+                if response.status_code not in RETRY_STATUSES or attempt >= self._max_retries:
+                    return response
+                response.close()
+                time.sleep(self._backoff_factor * (2 ** attempt))
+                attempt += 1
+
+
+@lru_cache(maxsize=None)
+def _shared_http2_client(timeout: int, max_retries: int, backoff_factor: float) -> "httpx.Client":
+    """
+    Process-wide HTTP/2 client; concurrent fetches multiplex over one TLS connection.
+
+    Connection errors and 429/5xx responses are retried like the requests sessions.
+    """
+    return httpx.Client(
+        http2=True,
+        timeout=timeout,
+        transport=_StatusRetryTransport(
+            http2=True,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+        ),
+    )
+
+
 @dataclass
 class EIAClient:
     api_key: Optional[str] = None
@@ -30,6 +206,8 @@ class EIAClient:
     max_retries: int = 3
     backoff_factor: float = 1.5
     session: Optional[Session] = None
+    use_http2: bool = True
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
 
     BASE_URL: str = "https://api.eia.gov/v2"
 
@@ -43,75 +221,122 @@ class EIAClient:
                 "pass api_key explicitly."
             )
 
-        if self.session is None:
-            self.session = requests.Session()
+    @cached_property
+    def _client_session(self):
+        """
+        The transport used by fetch, picked on first use in this order:
+
+        1. the injected ``session``;
+        2. the on-disk response cache, when ``cache_dir`` is set and requests-cache
+           is installed (a cache hit skips the network, so it wins over HTTP/2);
+        3. the HTTP/2 client, when ``use_http2`` is set and httpx/h2 are installed;
+        4. the plain pooled requests session.
 
-    def fetch(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        The shared transports all retry connection errors and RETRY_STATUSES with
+        ``max_retries`` and ``backoff_factor``. The cache cannot wrap the httpx
+        client, so with requests-cache installed HTTP/2 needs ``cache_dir=None``.
+        """
+        if self.session is not None:
+            return self.session
+        if self.cache_dir is not None and requests_cache is not None:
+            return _shared_cached_session(str(self.cache_dir), self.max_retries, self.backoff_factor)
+        if self.use_http2 and HTTP2_AVAILABLE:
+            return _shared_http2_client(self.timeout, self.max_retries, self.backoff_factor)
+        return _shared_session(self.max_retries, self.backoff_factor)
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, str]] = None,
+        *,
+        raw: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
         """
         Execute a GET request against the EIA API and return the payload as a DataFrame.
 
         Args:
             endpoint: URL suffix after the base v2 path, e.g. "petroleum/stoc/wstk/data".
             params: Query parameters (the API key is injected automatically).
+            raw: Keep every column as returned (strings) instead of parsing
+                "period" and "value"; used by the Bronze layer.
+            columns: Only build these fields of each record (missing ones become
+                None); EIA also returns names and units the Silver layer drops.
         """
-        params = dict(params or {})
-        params["api_key"] = self.api_key
+        params = {**(params or {}), "api_key": self.api_key}
+        url = _url_for(self.BASE_URL, endpoint)
 
-        url = f"{self.BASE_URL.rstrip('/')}/{endpoint.lstrip('/')}"
         attempt = 0
-
         while True:
             attempt += 1
             try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
+                response = self._client_session.get(url, params=params, timeout=self.timeout)
                 response.raise_for_status()
-                return self._to_dataframe(response)
-            except (requests.RequestException, EIAClientError) as exc:
-                if attempt >= self.max_retries:
-                    raise EIAClientError(f"EIA request failed after {attempt} attempts: {exc}") from exc
+            except _TRANSPORT_ERRORS as exc:
+                # The shared transports already retried connection errors and
+                # 429/5xx; an injected session has no such policy, so retry here
+                if self.session is None:
+                    raise EIAClientError(f"EIA request failed: {exc}") from exc
+                error: Exception = exc
+            else:
+                # A 200 with a truncated, malformed or empty body is invisible to
+                # the transport, so those are retried here for every transport
+                try:
+                    return self._to_dataframe(response, raw=raw, columns=columns)
+                except EIAClientError as exc:
+                    error = exc
 
-                sleep_seconds = self.backoff_factor ** (attempt - 1)
-                time.sleep(sleep_seconds)
+            if attempt >= self.max_retries:
+                raise EIAClientError(f"EIA request failed after {attempt} attempts: {error}") from error
+            time.sleep(self.backoff_factor ** (attempt - 1))
 
     @staticmethod
-    def _to_dataframe(response: Response) -> pd.DataFrame:
-        try:
-            payload = response.json()
-        except ValueError as exc:
-            raise EIAClientError("Failed to decode EIA response as JSON") from exc
-
-        if "response" not in payload or "data" not in payload["response"]:
-            raise EIAClientError(f"Unexpected EIA response format: {payload}")
-
-        data = payload["response"]["data"]
-        if not data:
-            raise EIAClientError("EIA response contained no rows")
-
-        return pd.DataFrame(data)
+    def _to_dataframe(
+        response: Response,
+        raw: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        data = _payload_rows(response.content)
+        if columns is None:
+            df = pd.DataFrame.from_records(data)
+        else:
+            df = pd.DataFrame({col: [row.get(col) for row in data] for col in columns})
+        return df if raw else typed_frame(df)
 
+@lru_cache(maxsize=1)
 def load_api_key_from_env_file() -> Optional[str]:
     """
     Load EIA API key from a local .env file if present.
     This keeps secrets out of source while still enabling scripted usage.
+    The result is cached, since every client construction falls back to it.
     """
-    env_path = Path(__file__).resolve().parents[2] / ".env"
-    if not env_path.exists():
+    try:
+        lines = ENV_PATH.read_bytes().splitlines()
+    except FileNotFoundError:
         return None
 
-    for line in env_path.read_text().splitlines():
+    for line in lines:
         line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("EIA_API_KEY="):
-            return line.split("=", 1)[1].strip().strip('"').strip("'")
+        if line.startswith(b"EIA_API_KEY="):
+            return line.split(b"=", 1)[1].strip().strip(b'"').strip(b"'").decode()
     return None
 
 
-def default_params(series_id: str, *, frequency: str, start: str, data_field: str = "value") -> Dict[str, str]:
+def default_params(
+    series_id: Union[str, Sequence[str]],
+    *,
+    frequency: str,
+    start: str,
+    data_field: str = "value",
+) -> Dict[str, Union[str, list]]:
     """
     Helper to construct common parameter payloads for series-based endpoints.
     EIA requires the series facet to be provided as facets[series][].
+    Pass several series IDs to fetch them in one request; rows are then
+    distinguished by the response's "series" column.
     """
+    if not isinstance(series_id, str):
+        series_id = list(series_id)
     return {
         "data[0]": data_field,
         "facets[series][]": series_id,
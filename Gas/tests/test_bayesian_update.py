@@ -3,6 +3,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 if str(SRC_DIR) not in sys.path:
@@ -17,7 +18,8 @@ def make_october_dataset():
     df["price_rbob"] = 2 + 0.01 * np.sin(np.arange(len(df)) / 10)
     df["crack_spread"] = 0.4 + 0.05 * np.cos(np.arange(len(df)) / 15)
     df["winter_blend_effect"] = -0.05 + 0.02 * np.tanh((df["date"].dt.day - 10) / 5)
-    df["days_since_oct1"] = (df["date"] - pd.to_datetime(df["date"].dt.year.astype(str) + "-10-01")).dt.days
+    oct1 = pd.to_datetime(pd.DataFrame({"year": df["date"].dt.year, "month": 10, "day": 1}))
+    df["days_since_oct1"] = (df["date"] - oct1).dt.days
     df["retail_price"] = df["price_rbob"] + 0.3 + 0.02 * np.sin(np.arange(len(df)) / 12)
     df["year"] = df["date"].dt.year
     df["month"] = df["date"].dt.month
@@ -26,8 +28,13 @@ def make_october_dataset():
     return df
 
 
-def test_produce_forecast_basic(tmp_path, monkeypatch):
-    df = make_october_dataset()
+@pytest.fixture(scope="session")
+def october_dataset():
+    return make_october_dataset()
+
+
+def test_produce_forecast_basic(tmp_path, monkeypatch, october_dataset):
+    df = october_dataset
     monkeypatch.setattr("models.bayesian_update.load_dataset", lambda path=None: df)
     forecast = produce_forecast(df, observation_day=10)
     assert isinstance(forecast.mean, float)
@@ -14,15 +14,24 @@ from download_eia_data import (  # noqa: E402
 )
 from download_padd3_data import fetch_padd3_share  # noqa: E402
 from download_retail_prices import fetch_retail_prices  # noqa: E402
-from eia_client import EIAClientError  # noqa: E402
+from eia_client import EIAClientError, typed_frame  # noqa: E402
 
 
 class StubClient:
     def __init__(self, responses_v2=None):
-        self.responses_v2 = responses_v2 or {}
+        # Parse (and thereby copy) each canned frame once; fetch hands out the
+        # stored frame, which the download functions never modify in place
+        self.responses_v2 = {key: typed_frame(df.copy()) for key, df in (responses_v2 or {}).items()}
         self.calls = []
 
-    def fetch(self, endpoint, params):
+    def fetch(self, endpoint, params, columns=None):
+        series = params.get("facets[series][]")
+        if isinstance(series, list):
+            self.calls.append(("v2", (endpoint, tuple(series))))
+            return pd.concat(
+                [self.responses_v2[(endpoint, s)].assign(series=s) for s in series],
+                ignore_index=True,
+            )
         if "facets[series][]" in params:
             key = (endpoint, params.get("facets[series][]"))
         elif "facets[product][]" in params and "facets[duoarea][]" in params:
@@ -35,7 +44,7 @@ class StubClient:
             key = (endpoint, None)
         self.calls.append(("v2", key))
         df = self.responses_v2[key]
-        return df.copy()
+        return df if columns is None else df[list(columns)]
 
 
 
@@ -91,6 +100,7 @@ def test_fetch_net_imports_success():
     df = fetch_net_imports(client)
     assert list(df.columns) == ["date", "net_imports_kbd"]
     assert df["net_imports_kbd"].iloc[0] == pytest.approx(800)
+    assert len(client.calls) == 1
 
 
 def test_fetch_padd3_share_success():
@@ -106,6 +116,7 @@ def test_fetch_padd3_share_success():
     df = fetch_padd3_share(client)
     assert list(df.columns) == ["date", "padd3_share"]
     assert df["padd3_share"].iloc[0] == pytest.approx(35.65, rel=1e-2)
+    assert len(client.calls) == 1
 
 
 def test_fetch_padd3_share_out_of_range():
@@ -1,9 +1,13 @@
+import io
+import json
 import sys
+import time
 from pathlib import Path
 
 import pandas as pd
 import pytest
 import requests
+import urllib3
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
 sys.path.append(str(SCRIPTS_DIR))
@@ -13,6 +17,7 @@ from eia_client import (  # noqa: E402
     EIAClientError,
     default_params,
 )
+from ingestion.eia_client import _has_rows  # noqa: E402
 
 
 class FakeResponse:
@@ -25,6 +30,12 @@ class FakeResponse:
         if self.status_code >= 400:
             raise requests.HTTPError(f"{self.status_code} error")
 
+    @property
+    def content(self):
+        if self._json_error:
+            return b"<html>not json</html>"
+        return json.dumps(self._payload).encode()
+
     def json(self):
         if self._json_error:
             raise ValueError("Invalid JSON")
@@ -69,7 +80,8 @@ def test_client_fetch_success(monkeypatch):
     client = EIAClient(api_key="test", session=session, max_retries=1)
     df = client.fetch("petroleum/test/data", {"frequency": "weekly"})
     assert isinstance(df, pd.DataFrame)
-    assert df.iloc[0]["period"] == "2020-10-02"
+    assert df.iloc[0]["period"] == pd.Timestamp("2020-10-02")
+    assert df["value"].dtype == "float64"
     assert session.calls[0][0].endswith("petroleum/test/data")
 
 
@@ -85,3 +97,122 @@ def test_client_handles_bad_json():
     client = EIAClient(api_key="test", session=session, max_retries=1)
     with pytest.raises(EIAClientError):
         client.fetch("petroleum/test/data", {})
+
+
+def test_client_fetch_selected_columns():
+    fake_data = payload([{"period": "2020-10-02", "value": "2.25", "area-name": "U.S.", "units": "$/GAL"}])
+    session = FakeSession([FakeResponse(payload=fake_data)])
+    client = EIAClient(api_key="test", session=session, max_retries=1)
+    df = client.fetch("petroleum/test/data", {}, columns=["period", "value"])
+    assert list(df.columns) == ["period", "value"]
+    assert df["value"].iloc[0] == pytest.approx(2.25)
+
+
+def test_client_values_keep_float64_precision():
+    fake_data = payload([{"period": "2020-10-02", "value": "3.456"}])
+    session = FakeSession([FakeResponse(payload=fake_data)])
+    client = EIAClient(api_key="test", session=session, max_retries=1)
+    df = client.fetch("petroleum/test/data", {})
+    assert df["value"].iloc[0] == 3.456
+
+
+def test_client_retries_bad_payload(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    fake_data = payload([{"period": "2020-10-02", "value": "1.5"}])
+    session = FakeSession([FakeResponse(json_error=True), FakeResponse(payload=fake_data)])
+    client = EIAClient(api_key="test", session=session, max_retries=2)
+    df = client.fetch("petroleum/test/data", {})
+    assert len(session.calls) == 2
+    assert df["value"].iloc[0] == pytest.approx(1.5)
+
+
+def test_client_retries_injected_session_errors(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    fake_data = payload([{"period": "2020-10-02", "value": "1.5"}])
+    session = FakeSession(
+        [requests.ConnectionError("reset"), FakeResponse(status_code=503), FakeResponse(payload=fake_data)]
+    )
+    client = EIAClient(api_key="test", session=session, max_retries=3)
+    df = client.fetch("petroleum/test/data", {})
+    assert len(session.calls) == 3
+    assert df["value"].iloc[0] == pytest.approx(1.5)
+
+
+def test_client_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    session = FakeSession([requests.ConnectionError("reset")] * 2)
+    client = EIAClient(api_key="test", session=session, max_retries=2)
+    with pytest.raises(EIAClientError, match="after 2 attempts"):
+        client.fetch("petroleum/test/data", {})
+    assert len(session.calls) == 2
+
+
+class RawResponse(FakeResponse):
+    def __init__(self, body):
+        super().__init__()
+        self._body = body
+
+    @property
+    def content(self):
+        return self._body
+
+
+def test_cache_filter_skips_unusable_bodies():
+    assert _has_rows(FakeResponse(payload=payload([{"period": "2020-10-02", "value": "1"}])))
+    assert not _has_rows(FakeResponse(payload=payload([])))
+    assert not _has_rows(FakeResponse(json_error=True))
+    # Spacing and a "data" key outside "response" must not fool the filter
+    assert not _has_rows(RawResponse(b'{"response": {"data" :\n []}}'))
+    assert not _has_rows(RawResponse(b'{"request": {"data": [1]}, "response": {"total": 0}}'))
+
+
+def _serve_bodies(monkeypatch, bodies):
+    """Answer every HTTP request with the next body instead of touching the network."""
+    sent = []
+
+    def send(adapter, request, **kwargs):
+        sent.append(request.url)
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(bodies.pop(0)),
+            headers={"Content-Type": "application/json"},
+            status=200,
+            preload_content=False,
+            request_url=request.url,
+        )
+        return adapter.build_response(request, raw)
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", send)
+    return sent
+
+
+def test_cache_serves_repeat_fetch_from_disk(tmp_path, monkeypatch):
+    pytest.importorskip("requests_cache")
+    body = json.dumps(payload([{"period": "2020-10-02", "value": "1.5"}])).encode()
+    sent = _serve_bodies(monkeypatch, [body])
+
+    for _ in range(2):
+        df = EIAClient(api_key="test", cache_dir=tmp_path).fetch("petroleum/test/data", {})
+        assert df["value"].iloc[0] == pytest.approx(1.5)
+    assert len(sent) == 1
+
+
+def test_cache_does_not_store_empty_body(tmp_path, monkeypatch):
+    pytest.importorskip("requests_cache")
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    empty = json.dumps(payload([])).encode()
+    body = json.dumps(payload([{"period": "2020-10-02", "value": "1.5"}])).encode()
+    sent = _serve_bodies(monkeypatch, [empty, body])
+
+    # The empty body is retried from the network, then the good one is cached
+    client = EIAClient(api_key="test", cache_dir=tmp_path, max_retries=2)
+    assert client.fetch("petroleum/test/data", {})["value"].iloc[0] == pytest.approx(1.5)
+    assert EIAClient(api_key="test", cache_dir=tmp_path).fetch("petroleum/test/data", {}).shape[0] == 1
+    assert len(sent) == 2
+
+
+def test_client_rejects_non_numeric_values():
+    fake_data = payload([{"period": "2020-10-02", "value": "1.5"}, {"period": "2020-10-09", "value": "n/a"}])
+    session = FakeSession([FakeResponse(payload=fake_data)])
+    client = EIAClient(api_key="test", session=session, max_retries=1)
+    with pytest.raises(EIAClientError, match="1 non-numeric"):
+        client.fetch("petroleum/test/data", {})
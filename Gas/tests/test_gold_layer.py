@@ -3,6 +3,8 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
@@ -11,9 +13,19 @@ sys.path.append(str(SCRIPTS_DIR))
 import build_gold_layer as bgl  # noqa: E402
 
 
-def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+@pytest.fixture(scope="session", autouse=True)
+def _warm_parquet(tmp_path_factory):
+    # Pay pyarrow's one-time parquet engine setup here rather than inside the first test
+    path = tmp_path_factory.mktemp("warm") / "warm.parquet"
+    pq.write_table(pa.table({"x": [0]}), path)
+    pd.read_parquet(path)
+
+
+def _write_parquet(columns: dict, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path, index=False)
+    # Build the Arrow table directly; fixture files are a few rows, so skip
+    # compression and column statistics as well
+    pq.write_table(pa.Table.from_pydict(columns), path, compression=None, write_statistics=False)
 
 
 def test_build_gold_layer_model_ready(tmp_path, monkeypatch):
@@ -23,45 +35,39 @@ def test_build_gold_layer_model_ready(tmp_path, monkeypatch):
     gold_dir.mkdir()
 
     retail_dates = pd.date_range("2020-10-03", "2020-10-25", freq="D")
-    retail_df = pd.DataFrame(
-        {
-            "date": retail_dates,
-            "retail_price": 2.00 + 0.01 * np.arange(len(retail_dates)),
-        }
-    )
-    _write_parquet(retail_df, silver_dir / "retail_prices_daily.parquet")
+    retail_cols = {
+        "date": retail_dates,
+        "retail_price": 2.00 + 0.01 * np.arange(len(retail_dates)),
+    }
+    _write_parquet(retail_cols, silver_dir / "retail_prices_daily.parquet")
 
     full_dates = pd.date_range("2020-10-01", "2020-10-25", freq="D")
     rbob_dates = full_dates[::2]  # every other day to test forward-fill
-    rbob_df = pd.DataFrame(
-        {
-            "date": rbob_dates,
-            "price_rbob": 1.80 + 0.01 * np.arange(len(rbob_dates)),
-            "volume_rbob": 900 + np.arange(len(rbob_dates)),
-        }
-    )
-    _write_parquet(rbob_df, silver_dir / "rbob_daily.parquet")
-
-    wti_df = pd.DataFrame(
-        {
-            "date": rbob_dates,
-            "price_wti": 65.0 + 0.5 * np.arange(len(rbob_dates)),
-        }
-    )
-    _write_parquet(wti_df, silver_dir / "wti_daily.parquet")
+    rbob_cols = {
+        "date": rbob_dates,
+        "price_rbob": 1.80 + 0.01 * np.arange(len(rbob_dates)),
+        "volume_rbob": 900 + np.arange(len(rbob_dates)),
+    }
+    _write_parquet(rbob_cols, silver_dir / "rbob_daily.parquet")
+
+    wti_cols = {
+        "date": rbob_dates,
+        "price_wti": 65.0 + 0.5 * np.arange(len(rbob_dates)),
+    }
+    _write_parquet(wti_cols, silver_dir / "wti_daily.parquet")
 
     weekly_dates = pd.to_datetime(["2020-10-05", "2020-10-12", "2020-10-19"])
-    inventory_df = pd.DataFrame({"date": weekly_dates, "inventory_mbbl": [230.0, 231.0, 229.5]})
-    _write_parquet(inventory_df, silver_dir / "eia_inventory_weekly.parquet")
+    inventory_cols = {"date": weekly_dates, "inventory_mbbl": [230.0, 231.0, 229.5]}
+    _write_parquet(inventory_cols, silver_dir / "eia_inventory_weekly.parquet")
 
-    utilization_df = pd.DataFrame({"date": weekly_dates, "utilization_pct": [85.0, 87.5, 86.0]})
-    _write_parquet(utilization_df, silver_dir / "eia_utilization_weekly.parquet")
+    utilization_cols = {"date": weekly_dates, "utilization_pct": [85.0, 87.5, 86.0]}
+    _write_parquet(utilization_cols, silver_dir / "eia_utilization_weekly.parquet")
 
-    imports_df = pd.DataFrame({"date": weekly_dates, "net_imports_kbd": [500.0, 520.0, 510.0]})
-    _write_parquet(imports_df, silver_dir / "eia_imports_weekly.parquet")
+    imports_cols = {"date": weekly_dates, "net_imports_kbd": [500.0, 520.0, 510.0]}
+    _write_parquet(imports_cols, silver_dir / "eia_imports_weekly.parquet")
 
-    padd3_df = pd.DataFrame({"date": weekly_dates, "padd3_share": [35.0, 36.0, 34.5]})
-    _write_parquet(padd3_df, silver_dir / "padd3_share_weekly.parquet")
+    padd3_cols = {"date": weekly_dates, "padd3_share": [35.0, 36.0, 34.5]}
+    _write_parquet(padd3_cols, silver_dir / "padd3_share_weekly.parquet")
 
     monkeypatch.setattr(bgl, "SILVER_DIR", silver_dir)
     monkeypatch.setattr(bgl, "GOLD_DIR", gold_dir)
@@ -96,14 +102,12 @@ def test_build_gold_layer_missing_required(tmp_path, monkeypatch):
     silver_dir.mkdir()
     gold_dir.mkdir()
 
-    rbob_df = pd.DataFrame(
-        {
-            "date": pd.to_datetime(["2020-10-01"]),
-            "price_rbob": [1.9],
-            "volume_rbob": [1000],
-        }
-    )
-    _write_parquet(rbob_df, silver_dir / "rbob_daily.parquet")
+    rbob_cols = {
+        "date": pd.to_datetime(["2020-10-01"]),
+        "price_rbob": [1.9],
+        "volume_rbob": [1000],
+    }
+    _write_parquet(rbob_cols, silver_dir / "rbob_daily.parquet")
 
     monkeypatch.setattr(bgl, "SILVER_DIR", silver_dir)
     monkeypatch.setattr(bgl, "GOLD_DIR", gold_dir)
@@ -17,7 +17,7 @@ from models.baseline_models import (  # noqa: E402
     train_all_models,
 )  # noqa: E402
 
-from walk_forward_validation import walk_forward_forecasts, plot_walk_forward  # noqa: E402
+from walk_forward_validation import fold_metrics, walk_forward_forecasts, plot_walk_forward  # noqa: E402
 
 
 def _mock_master_model_ready() -> pd.DataFrame:
@@ -44,8 +44,10 @@ def _mock_master_model_ready() -> pd.DataFrame:
     df["rbob_return_1d"] = df["price_rbob"].pct_change().fillna(0)
     df["vol_rbob_10d"] = df["rbob_return_1d"].rolling(10).std().fillna(0)
 
-    df["winter_blend_effect"] = -0.12 * (1 - np.exp(-0.2 * np.maximum((df["date"] - pd.to_datetime(df["date"].dt.year.astype(str) + "-10-01")).dt.days, 0)))
-    df["days_since_oct1"] = np.maximum((df["date"] - pd.to_datetime(df["date"].dt.year.astype(str) + "-10-01")).dt.days, 0)
+    oct1 = pd.to_datetime(pd.DataFrame({"year": df["date"].dt.year, "month": 10, "day": 1}))
+    days_since_oct1 = np.maximum((df["date"] - oct1).dt.days, 0)
+    df["winter_blend_effect"] = -0.12 * (1 - np.exp(-0.2 * days_since_oct1))
+    df["days_since_oct1"] = days_since_oct1
     df["target"] = df["retail_price"]
 
     df = df.dropna().reset_index(drop=True)
@@ -91,6 +93,30 @@ def test_train_all_models_outputs(tmp_path, mock_dataset):
     assert not ensemble_out.predictions.empty
 
 
+def test_fold_metrics_matches_sklearn():
+    from sklearn.metrics import mean_absolute_error, mean_absolute_percentage_error, mean_squared_error, r2_score
+
+    y_true = np.array([3.1, 3.4, np.nan, 2.9, 3.0, 3.3])
+    y_pred = np.array([3.0, 3.5, 3.2, np.inf, 3.1, 3.25])
+    metrics = fold_metrics(y_true, y_pred)
+
+    valid = np.isfinite(y_true) & np.isfinite(y_pred)
+    t, p = y_true[valid], y_pred[valid]
+    assert metrics["rmse"] == pytest.approx(np.sqrt(mean_squared_error(t, p)))
+    assert metrics["mae"] == pytest.approx(mean_absolute_error(t, p))
+    assert metrics["r2"] == pytest.approx(r2_score(t, p))
+    assert metrics["mape_pct"] == pytest.approx(100 * mean_absolute_percentage_error(t, p))
+
+
+def test_fold_metrics_undefined_cases_are_nan():
+    assert all(np.isnan(v) for v in fold_metrics(np.array([np.nan]), np.array([1.0])).values())
+
+    zeros = fold_metrics(np.zeros(3), np.array([0.1, -0.1, 0.0]))
+    assert np.isnan(zeros["mape_pct"])
+    assert np.isnan(zeros["r2"])
+    assert zeros["mae"] == pytest.approx(0.2 / 3)
+
+
 def test_walk_forward_forecasts(tmp_path, mock_dataset):
     horizons = [7, 3]
     years = [2022, 2023]
@@ -105,3 +131,22 @@ def test_walk_forward_forecasts(tmp_path, mock_dataset):
     plot_walk_forward(preds, tmp_path)
     pngs = list(tmp_path.glob("walk_forward_h*.png"))
     assert pngs, "Expected walk-forward plots to be created"
+
+
+def test_walk_forward_cache_rebuilds_when_features_change(tmp_path, monkeypatch, mock_dataset):
+    import walk_forward_validation as wfv
+
+    data_path = tmp_path / "master_model_ready.parquet"
+    cache_path = tmp_path / "cache.parquet"
+    mock_dataset.to_parquet(data_path, index=False)
+    monkeypatch.setattr(wfv, "load_model_ready_dataset", lambda path: pd.read_parquet(path))
+
+    first = wfv.load_dataset_cached(data_path, cache_path)
+    assert list(first.columns) == ["date", "retail_price", *COMMON_FEATURES]
+
+    # A changed feature list must not be served from the old cache
+    spare = next(c for c in mock_dataset.columns if c not in COMMON_FEATURES and c not in ("date", "retail_price"))
+    features = [*COMMON_FEATURES[:-1], spare]
+    monkeypatch.setattr(wfv, "COMMON_FEATURES", features)
+    second = wfv.load_dataset_cached(data_path, cache_path)
+    assert list(second.columns) == ["date", "retail_price", *features]
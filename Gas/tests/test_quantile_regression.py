@@ -15,6 +15,7 @@ from models.quantile_regression import prepare_features, train_quantile_models
 def make_dataset() -> pd.DataFrame:
     dates = pd.date_range("2021-01-01", periods=500, freq="D")
     t = np.arange(len(dates))
+    oct1 = pd.DatetimeIndex(pd.to_datetime(pd.DataFrame({"year": dates.year, "month": 10, "day": 1})))
     df = pd.DataFrame({
         "date": dates,
         "price_rbob": 2 + 0.01 * np.sin(t / 10),
@@ -29,20 +30,25 @@ def make_dataset() -> pd.DataFrame:
         "rbob_lag14": 2 + 0.01 * np.sin((t-14) / 10),
         "delta_rbob_1w": 0.01 * (np.sin(t/10) - np.sin((t-7)/10)),
         "winter_blend_effect": -0.05 + 0.01 * np.cos(t / 35),
-        "days_since_oct1": np.maximum((dates - pd.to_datetime(dates.year.astype(str) + "-10-01")).days, 0),
+        "days_since_oct1": np.maximum((dates - oct1).days, 0),
     })
     df["retail_price"] = df["price_rbob"] + df["retail_margin"] + 0.02 * np.sin(t / 12)
     return df
 
 
+@pytest.fixture(scope="session")
+def quantile_dataset():
+    return make_dataset()
+
+
 def test_prepare_features_missing_columns():
     df = pd.DataFrame({"date": pd.date_range("2020-01-01", periods=5), "retail_price": [2, 2, 2, 2, 2]})
     with pytest.raises(ValueError):
         prepare_features(df)
 
 
-def test_train_quantile_models(tmp_path):
-    df = make_dataset()
+def test_train_quantile_models(tmp_path, quantile_dataset):
+    df = quantile_dataset
     results = train_quantile_models(df, output_dir=tmp_path, quantiles=[0.1, 0.5], test_start="2021-12-01")
     assert set(results.keys()) == {0.1, 0.5}
     for res in results.values():
@@ -1,48 +1,76 @@
+import shutil
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
 sys.path.append(str(SCRIPTS_DIR))
 
-import validate_silver_layer as vs  # noqa: E402
-import validate_gold_layer as vg  # noqa: E402
 
+# The scripts are imported on first use so a filtered run (-k gold) skips the others
+@pytest.fixture(scope="session")
+def vs():
+    import validate_silver_layer
 
-def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    return validate_silver_layer
+
+
+@pytest.fixture(scope="session")
+def vg():
+    import validate_gold_layer
+
+    return validate_gold_layer
+
+
+def _stage_parquet(frames: dict, df: pd.DataFrame, path: Path) -> None:
+    """Register df as the contents of path; an empty file keeps exists() checks honest."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path, index=False)
+    path.touch()
+    frames[path.name] = df
+
 
+def _serve_frames(monkeypatch, module, frames: dict) -> None:
+    # The validators only need the frames, so skip the parquet encode/decode
+    monkeypatch.setattr(module.pd, "read_parquet", lambda path, **kwargs: frames[Path(path).name].copy())
 
-def test_validate_silver_layer_success(tmp_path, monkeypatch, capsys):
-    silver_dir = tmp_path / "silver"
-    silver_dir.mkdir()
 
-    dates = pd.date_range("2024-01-01", periods=5, freq="D")
+@pytest.fixture(scope="session")
+def silver_success_tree(tmp_path_factory):
+    """A complete Silver layer, staged once; the validator only reads it."""
+    silver_dir = tmp_path_factory.mktemp("silver")
+    frames = {}
+
+    dates = np.arange("2024-01-01", "2024-01-06", dtype="datetime64[D]").astype("datetime64[ns]")
     rbob_df = pd.DataFrame({"date": dates, "price_rbob": 1.9, "volume_rbob": 1000})
-    _write_parquet(rbob_df, silver_dir / "rbob_daily.parquet")
+    _stage_parquet(frames, rbob_df, silver_dir / "rbob_daily.parquet")
 
     wti_df = pd.DataFrame({"date": dates, "price_wti": 70.0})
-    _write_parquet(wti_df, silver_dir / "wti_daily.parquet")
+    _stage_parquet(frames, wti_df, silver_dir / "wti_daily.parquet")
 
     retail_df = pd.DataFrame({"date": dates, "retail_price": 2.5})
-    _write_parquet(retail_df, silver_dir / "retail_prices_daily.parquet")
+    _stage_parquet(frames, retail_df, silver_dir / "retail_prices_daily.parquet")
 
-    weekly_dates = pd.to_datetime(["2024-01-03", "2024-01-10"])
+    weekly_dates = np.array(["2024-01-03", "2024-01-10"], dtype="datetime64[ns]")
     inventory_df = pd.DataFrame({"date": weekly_dates, "inventory_mbbl": [230.0, 231.0]})
-    _write_parquet(inventory_df, silver_dir / "eia_inventory_weekly.parquet")
+    _stage_parquet(frames, inventory_df, silver_dir / "eia_inventory_weekly.parquet")
 
     utilization_df = pd.DataFrame({"date": weekly_dates, "utilization_pct": [85.0, 86.0]})
-    _write_parquet(utilization_df, silver_dir / "eia_utilization_weekly.parquet")
+    _stage_parquet(frames, utilization_df, silver_dir / "eia_utilization_weekly.parquet")
 
     imports_df = pd.DataFrame({"date": weekly_dates, "net_imports_kbd": [500.0, 520.0]})
-    _write_parquet(imports_df, silver_dir / "eia_imports_weekly.parquet")
+    _stage_parquet(frames, imports_df, silver_dir / "eia_imports_weekly.parquet")
 
     padd3_df = pd.DataFrame({"date": weekly_dates, "padd3_share": [35.0, 36.0]})
-    _write_parquet(padd3_df, silver_dir / "padd3_share_weekly.parquet")
+    _stage_parquet(frames, padd3_df, silver_dir / "padd3_share_weekly.parquet")
+    return silver_dir, frames
+
 
+def test_validate_silver_layer_success(vs, silver_success_tree, monkeypatch, capsys):
+    silver_dir, frames = silver_success_tree
+    _serve_frames(monkeypatch, vs, frames)
     monkeypatch.setattr(vs, "SILVER_DIR", silver_dir)
 
     assert vs.validate_silver_layer() is True
@@ -50,48 +78,68 @@ def test_validate_silver_layer_success(tmp_path, monkeypatch, capsys):
     assert "✓" in captured.out
 
 
-def test_validate_silver_layer_missing_file(tmp_path, monkeypatch, capsys):
-    silver_dir = tmp_path / "silver"
-    silver_dir.mkdir()
-
-    dates = pd.date_range("2024-01-01", periods=3, freq="D")
-    rbob_df = pd.DataFrame({"date": dates, "price_rbob": 1.9, "volume_rbob": 900})
-    _write_parquet(rbob_df, silver_dir / "rbob_daily.parquet")
-
+@pytest.mark.parametrize(
+    "missing",
+    [
+        "rbob_daily.parquet",
+        "wti_daily.parquet",
+        "retail_prices_daily.parquet",
+        "eia_inventory_weekly.parquet",
+        "eia_utilization_weekly.parquet",
+        "eia_imports_weekly.parquet",
+        "padd3_share_weekly.parquet",
+    ],
+)
+def test_validate_silver_layer_missing_file(vs, silver_success_tree, missing, tmp_path, monkeypatch, capsys):
+    tree_dir, frames = silver_success_tree
+    # Only the empty sentinel files are copied; the frames stay shared
+    silver_dir = shutil.copytree(tree_dir, tmp_path / "silver")
+    (silver_dir / missing).unlink()
+
+    _serve_frames(monkeypatch, vs, frames)
     monkeypatch.setattr(vs, "SILVER_DIR", silver_dir)
 
     assert vs.validate_silver_layer() is False
     captured = capsys.readouterr()
-    assert "MISSING" in captured.out
+    assert f"MISSING: {missing}" in captured.out
 
 
-def test_validate_gold_layer_success(tmp_path, monkeypatch, capsys):
-    gold_dir = tmp_path / "gold"
-    gold_dir.mkdir()
+@pytest.fixture(scope="session")
+def gold_success_tree(vg, tmp_path_factory):
+    """Gold frames with every core column, staged once and shared read-only."""
+    gold_dir = tmp_path_factory.mktemp("gold")
+    frames = {}
 
     columns = vg.CORE_COLUMNS
-    base_dates = pd.date_range("2024-10-01", periods=2, freq="D")
+    base_dates = np.arange("2024-10-01", "2024-10-03", dtype="datetime64[D]").astype("datetime64[ns]")
+    # Pre-typed arrays, so the frame is assembled without per-cell dtype inference
     base_df = pd.DataFrame(
         {
             "date": base_dates,
-            "retail_price": [2.5, 2.6],
-            "price_rbob": [2.0, 2.02],
-            "price_wti": [70.0, 71.0],
-            "crack_spread": [0.5, 0.58],
-            "retail_margin": [0.5, 0.58],
-            "rbob_lag3": [1.95, 1.96],
-            "rbob_lag7": [1.9, 1.91],
-            "rbob_lag14": [1.85, 1.86],
-            "delta_rbob_1w": [0.1, 0.1],
-            "vol_rbob_10d": [0.01, 0.01],
-            "winter_blend_effect": [-0.05, -0.06],
-            "target": [2.5, 2.6],
-        }
+            "retail_price": np.array([2.5, 2.6]),
+            "price_rbob": np.array([2.0, 2.02]),
+            "price_wti": np.array([70.0, 71.0]),
+            "crack_spread": np.array([0.5, 0.58]),
+            "retail_margin": np.array([0.5, 0.58]),
+            "rbob_lag3": np.array([1.95, 1.96]),
+            "rbob_lag7": np.array([1.9, 1.91]),
+            "rbob_lag14": np.array([1.85, 1.86]),
+            "delta_rbob_1w": np.array([0.1, 0.1]),
+            "vol_rbob_10d": np.array([0.01, 0.01]),
+            "winter_blend_effect": np.array([-0.05, -0.06]),
+            "target": np.array([2.5, 2.6]),
+        },
+        copy=False,
     )
 
     for name in ["master_daily.parquet", "master_october.parquet", "master_model_ready.parquet"]:
-        _write_parquet(base_df, gold_dir / name)
+        _stage_parquet(frames, base_df, gold_dir / name)
+    return gold_dir, frames
 
+
+def test_validate_gold_layer_success(vg, gold_success_tree, monkeypatch, capsys):
+    gold_dir, frames = gold_success_tree
+    _serve_frames(monkeypatch, vg, frames)
     monkeypatch.setattr(vg, "GOLD_DIR", gold_dir)
 
     assert vg.validate_gold_layer() is True
@@ -99,23 +147,13 @@ def test_validate_gold_layer_success(tmp_path, monkeypatch, capsys):
     assert "Ready for modeling" in captured.out
 
 
-def test_validate_gold_layer_missing_column(tmp_path, monkeypatch, capsys):
-    gold_dir = tmp_path / "gold"
-    gold_dir.mkdir()
-
-    df = pd.DataFrame(
-        {
-            "date": pd.to_datetime(["2024-10-01"]),
-            "retail_price": [2.5],
-            "price_rbob": [2.0],
-        }
-    )
-    _write_parquet(df, gold_dir / "master_daily.parquet")
-    _write_parquet(df, gold_dir / "master_october.parquet")
-    _write_parquet(df, gold_dir / "master_model_ready.parquet")
-
+@pytest.mark.parametrize("dropped", ["retail_price", "crack_spread", "winter_blend_effect", "target"])
+def test_validate_gold_layer_missing_column(vg, gold_success_tree, dropped, monkeypatch, capsys):
+    gold_dir, frames = gold_success_tree
+    _serve_frames(monkeypatch, vg, {name: df.drop(columns=dropped) for name, df in frames.items()})
     monkeypatch.setattr(vg, "GOLD_DIR", gold_dir)
 
     assert vg.validate_gold_layer() is False
     captured = capsys.readouterr()
     assert "Missing expected columns" in captured.out
+    assert dropped in captured.out
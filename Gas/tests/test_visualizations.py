@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.append(str(SCRIPTS_DIR))
+
+import visualize_performance_metrics as vpm  # noqa: E402
+from gold_cache import downcast_plot_columns  # noqa: E402
+
+
+@pytest.mark.parametrize("n", [1001, 1500, 1999, 2190, 5000])
+def test_downsample_min_caps_vertices(n):
+    x = np.arange(n)
+    y = np.full(n, 100.0)
+    y[n // 2] = 96.0  # a single gap must survive bucketing
+
+    xs, ys = vpm._downsample_min(x, y)
+    assert len(xs) == len(ys) <= vpm.MAX_LINE_POINTS
+    assert ys.min() == 96.0
+
+
+def test_downsample_min_leaves_short_series():
+    x = np.arange(10)
+    y = np.linspace(0, 1, 10)
+    xs, ys = vpm._downsample_min(x, y)
+    assert xs is x and ys is y
+
+
+def test_annotated_heatmap_leaves_nan_cells_blank():
+    from matplotlib.figure import Figure
+
+    ax = Figure().subplots()
+    frame = pd.DataFrame([[0.5, np.nan], [np.nan, 0.25]], columns=["a", "b"], index=["x", "y"])
+    vpm._annotated_heatmap(ax, frame, ".2f", "viridis")
+    assert sorted(t.get_text() for t in ax.texts) == ["0.25", "0.50"]
+
+
+def test_downcast_plot_columns_skips_absent_and_other_columns():
+    df = pd.DataFrame({"retail_price": [3.1, 3.2], "crack_spread": [0.5, 0.6]})
+    out = downcast_plot_columns(df)
+    assert out is df
+    assert df["retail_price"].dtype == np.float32
+    assert df["crack_spread"].dtype == np.float64
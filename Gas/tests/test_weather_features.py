@@ -1,4 +1,5 @@
 import os
+from collections import namedtuple
 from datetime import datetime
 
 import numpy as np
@@ -15,69 +16,104 @@ SCRIPTS_DIR = REPO_ROOT / "Gas" / "scripts"
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 
-from download_noaa_temp import prepare_temperature_features  # type: ignore  # noqa: E402
-from process_hurricane_risk_october import (  # type: ignore  # noqa: E402
-    prepare_gulf_october_dataset,
-    parse_hurdat_lines,
-)
 
+# Script modules are imported on first use, so deselected tests don't pay for them
+@pytest.fixture(scope="session")
+def noaa():
+    import download_noaa_temp  # type: ignore
 
-def test_prepare_temperature_features_computes_anomalies():
-    dates = pd.date_range("2024-01-01", periods=40, freq="D")
-    temps = np.linspace(20, 30, 40)  # gradual warming
+    return download_noaa_temp
+
+
+@pytest.fixture(scope="session")
+def hurricane():
+    import process_hurricane_risk_october  # type: ignore
+
+    return process_hurricane_risk_october
+
+
+TemperatureFixture = namedtuple("TemperatureFixture", ["input_df", "expected_cdd", "expected_anomaly"])
+
+
+@pytest.fixture(scope="module")
+def temp_fixture():
+    # Just past the 30-day min_periods of the rolling baseline
+    dates = pd.date_range("2024-01-01", periods=32, freq="D")
+    temps = np.linspace(20, 30, 32)  # gradual warming
     df = pd.DataFrame(
         {
             "date": np.repeat(dates, 2),
-            "station": ["A", "B"] * 40,
+            "station": ["A", "B"] * 32,
             "temp_c": np.tile(temps, 2),
         }
     )
 
-    result = prepare_temperature_features(df)
+    daily = df.groupby("date")["temp_c"].mean()
+    expected_cdd = np.maximum(daily - 18.0, 0.0)
+    expected_anomaly = daily - daily.rolling(365, min_periods=30).mean()
+    return TemperatureFixture(df, expected_cdd, expected_anomaly)
+
+
+def test_prepare_temperature_features_computes_anomalies(noaa, temp_fixture):
+    result = noaa.prepare_temperature_features(temp_fixture.input_df.copy())
     assert set(
         ["date", "temp_c", "temp_anomaly", "temp_anomaly_c", "temp_anomaly_f", "temp_f",
          "cooling_degree_day", "cooling_degree_day_anomaly"]
     ).issubset(result.columns)
 
     result = result.set_index("date")
-    expected_cdd = np.maximum(result["temp_c"] - 18.0, 0.0)
     np.testing.assert_allclose(
         result["cooling_degree_day"].iloc[-5:],
-        expected_cdd.iloc[-5:],
+        temp_fixture.expected_cdd.iloc[-5:],
         rtol=1e-5,
         atol=1e-5,
     )
-    rolling = result["temp_c"].rolling(365, min_periods=30).mean()
-    expected_anomaly = result["temp_c"] - rolling
+    # Compare the warm-up NaN pattern once, then only the computed values
+    anomaly = result["temp_anomaly"].to_numpy()
+    expected = temp_fixture.expected_anomaly.to_numpy()
+    computed = ~np.isnan(expected)
+    # The short fixture must still cover both the warm-up and computed rows
+    assert computed.any() and not computed.all()
+    np.testing.assert_array_equal(~np.isnan(anomaly), computed)
     np.testing.assert_allclose(
-        result["temp_anomaly"],
-        expected_anomaly,
+        anomaly[computed],
+        expected[computed],
         rtol=1e-5,
         atol=1e-5,
-        equal_nan=True,
     )
 
 
-def test_prepare_gulf_october_dataset_from_sample(monkeypatch):
-    sample_text = """AL012020, ARTHUR, 2020, 4
+_SAMPLE_HURDAT = """AL012020, ARTHUR, 2020, 4
 20200516, 0000, , TD, 30.0N, 75.0W, 35, 1005, 34, 0, 0, 0,
 20201007, 1200, , TS, 26.0N, 90.0W, 50, 995, 50, 0, 0, 0,
 AL022021, BETA, 2021, 3
 20211005, 0600, , TS, 24.0N, 88.0W, 45, 1000, 45, 0, 0, 0,
 20211006, 1200, , TS, 20.0N, 93.0W, 55, 998, 55, 0, 0, 0,
 """
-    fixes = parse_hurdat_lines(sample_text)
 
+
+@pytest.fixture(scope="module")
+def hurdat_fixes(hurricane):
+    # Parsed once; prepare_gulf_october_dataset only reads the fixes
+    return hurricane.parse_hurdat_lines(_SAMPLE_HURDAT)
+
+
+def test_prepare_gulf_october_dataset_from_sample(hurricane, hurdat_fixes, monkeypatch):
     monkeypatch.setenv("HURRICANE_START", "2020")
     monkeypatch.setenv("HURRICANE_END", "2021")
 
-    dataset = prepare_gulf_october_dataset(fixes)
-    dataset = dataset.set_index("date")
+    dataset = hurricane.prepare_gulf_october_dataset(hurdat_fixes)
+
+    # Rows are in date order, so look days up by position instead of building an index
+    dates = dataset["date"].to_numpy("datetime64[D]")
+    i_2020, i_2021 = np.searchsorted(dates, np.array(["2020-10-07", "2021-10-06"], dtype="datetime64[D]"))
+    assert dates[i_2020] == np.datetime64("2020-10-07")
+    assert dates[i_2021] == np.datetime64("2021-10-06")
 
     # October 7 2020 should register one storm
-    assert dataset.loc["2020-10-07", "storm_count"] == 1
-    assert pytest.approx(dataset.loc["2020-10-07", "storm_prob"], rel=1e-5) == 0.5
+    assert dataset["storm_count"].to_numpy()[i_2020] == 1
+    assert pytest.approx(dataset["storm_prob"].to_numpy()[i_2020], rel=1e-5) == 0.5
 
     # October 6 2021 has at least one storm with 55 kt winds
-    assert dataset.loc["2021-10-06", "max_wind_kt"] == 55
-    assert dataset.loc["2021-10-06", "shut_in_est"] > 0.0
+    assert dataset["max_wind_kt"].to_numpy()[i_2021] == 55
+    assert dataset["shut_in_est"].to_numpy()[i_2021] > 0.0